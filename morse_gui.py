@@ -12,6 +12,7 @@ Author: Generated with Claude Code
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import json
+import functools
 import threading
 import time
 import os
@@ -895,7 +896,8 @@ class MorseCodeGUI:
         tree.column('Meaning', width=350, anchor=tk.W)
         tree.column('Category', width=150, anchor=tk.W)
 
-        # Find category for each abbreviation
+        # Find category for each abbreviation (cached across display updates)
+        @functools.lru_cache(maxsize=None)
         def get_category(abbr):
             for category, abbrs in ABBREVIATION_CATEGORIES.items():
                 if abbr in abbrs:
@@ -904,9 +906,8 @@ class MorseCodeGUI:
 
         # Populate tree
         def update_display(*args):
-            # Clear tree
-            for item in tree.get_children():
-                tree.delete(item)
+            # Clear tree in a single Tcl call
+            tree.delete(*tree.get_children())
 
             search_text = search_var.get().upper()
             selected_category = category_var.get()
@@ -938,9 +939,26 @@ class MorseCodeGUI:
         status_label = ttk.Label(status_frame, text="")
         status_label.pack(side=tk.LEFT)
 
+        # Debounce search updates so a burst of keystrokes rebuilds once
+        pending_update = [None]
+
+        def schedule_update(*args):
+            if pending_update[0] is not None:
+                glossary_window.after_cancel(pending_update[0])
+            pending_update[0] = glossary_window.after(150, update_display)
+
+        def cancel_pending_update(event):
+            # <Destroy> also fires for each child widget; only act on the window
+            # itself, so a queued update never runs against a destroyed Treeview
+            if event.widget is glossary_window and pending_update[0] is not None:
+                glossary_window.after_cancel(pending_update[0])
+                pending_update[0] = None
+
+        glossary_window.bind('<Destroy>', cancel_pending_update, add='+')
+
         # Bind search updates
-        search_var.trace_add('write', update_display)
-        category_var.trace_add('write', update_display)
+        search_var.trace_add('write', schedule_update)
+        category_var.trace_add('write', schedule_update)
 
         # Initial display
         update_display()
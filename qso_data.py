@@ -15,7 +15,9 @@ Issue: #2 - QSO Feature: Data Module Foundation
 """
 
 import re
+import random
 import logging
+import itertools
 
 # ============================================================================
 # ABBREVIATION DICTIONARY
@@ -252,6 +254,20 @@ RST_REPORTS = [
 # VALIDATION AND SANITIZATION FUNCTIONS
 # ============================================================================
 
+# Validation patterns, compiled once at import
+_NAME_PATTERN = re.compile(r'^[A-Z][A-Z\s]{1,19}$')
+_QTH_PATTERN = re.compile(r'^[A-Z][A-Z\s]{1,29}$')
+_RST_PATTERN = re.compile(r'^[1-5][1-9][1-9]$')
+_EQUIPMENT_PATTERN = re.compile(r'^[A-Z0-9][A-Z0-9\s]{1,29}$')
+_POWER_PATTERN = re.compile(r'^\d{1,4}W$')
+_CONDITION_PATTERN = re.compile(r'^[A-Z0-9\s\-/]{1,30}$')
+
+# sanitize_text removes control characters and null bytes (via str.translate),
+# then anything outside the allowed character set
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(0x20), 0x7F])
+_DISALLOWED_CHARS_PATTERN = re.compile(r'[^A-Z0-9\s\-/]')
+
+
 def validate_name(name):
     """
     Validate operator name.
@@ -269,7 +285,7 @@ def validate_name(name):
         return False
 
     # Names should be 2-20 uppercase letters/spaces only
-    if not re.match(r'^[A-Z][A-Z\s]{1,19}$', name.strip()):
+    if not _NAME_PATTERN.match(name.strip()):
         logging.warning(f"Invalid name format: {name}")
         return False
 
@@ -298,7 +314,7 @@ def validate_qth(qth):
         return False
 
     # QTH should be 2-30 uppercase letters/spaces only
-    if not re.match(r'^[A-Z][A-Z\s]{1,29}$', qth.strip()):
+    if not _QTH_PATTERN.match(qth.strip()):
         logging.warning(f"Invalid QTH format: {qth}")
         return False
 
@@ -322,7 +338,7 @@ def validate_rst(rst):
         return False
 
     # RST must be exactly 3 digits: R(1-5), S(1-9), T(1-9)
-    if not re.match(r'^[1-5][1-9][1-9]$', rst):
+    if not _RST_PATTERN.match(rst):
         logging.warning(f"Invalid RST format: {rst}")
         return False
 
@@ -346,7 +362,7 @@ def validate_equipment(equipment):
         return False
 
     # Equipment should be 2-30 alphanumeric characters/spaces
-    if not re.match(r'^[A-Z0-9][A-Z0-9\s]{1,29}$', equipment.strip()):
+    if not _EQUIPMENT_PATTERN.match(equipment.strip()):
         logging.warning(f"Invalid equipment format: {equipment}")
         return False
 
@@ -370,7 +386,7 @@ def validate_power(power):
         return False
 
     # Power should be 1-4 digits followed by 'W'
-    if not re.match(r'^\d{1,4}W$', power):
+    if not _POWER_PATTERN.match(power):
         logging.warning(f"Invalid power format: {power}")
         return False
 
@@ -407,7 +423,7 @@ def sanitize_text(text, max_length=100):
     text = text.upper().strip()
 
     # Remove control characters and null bytes
-    text = re.sub(r'[\x00-\x1F\x7F]', '', text)
+    text = text.translate(_CONTROL_CHARS_TABLE)
 
     # Limit length
     if len(text) > max_length:
@@ -415,7 +431,7 @@ def sanitize_text(text, max_length=100):
         text = text[:max_length]
 
     # Only allow alphanumeric, spaces, and common punctuation
-    text = re.sub(r'[^A-Z0-9\s\-/]', '', text)
+    text = _DISALLOWED_CHARS_PATTERN.sub('', text)
 
     return text
 
@@ -453,10 +469,23 @@ EQUIPMENT_BY_TYPE = {
     'elecraft': ELECRAFT_RIGS,
 }
 
+# ============================================================================
+# SHARED RANDOM SOURCE
+# ============================================================================
+
+# Single Random instance shared by all generators in this module. Seeding it
+# (via QSOGenerator(seed=...)) makes bulk generation reproducible without
+# touching the global random module state.
+_rng = random.Random()
+
 # ============================================================================
 # CALL SIGN GENERATOR
 # ============================================================================
 
+# General call sign pattern: starts with letters, contains digit, ends with letters
+# This is a simplified check - actual validation would be region-specific
+CALLSIGN_PATTERN = re.compile(r'^[A-Z]{1,2}\d[A-Z]{2,4}$')
+
 class CallSignGenerator:
     """
     Generate realistic amateur radio call signs for various regions.
@@ -478,6 +507,26 @@ class CallSignGenerator:
     Issue: #3 - QSO Feature: Call Sign Generator
     """
 
+    # Region name, generator method and selection weight, weighted to favor
+    # US/UK/EU for European user (US gets most, Japan least). Names, methods
+    # and cumulative weights are all derived from this one table, so they
+    # cannot drift apart; cumulative weights let random.choices bisect directly.
+    _REGIONS = (
+        ('us', 'generate_us', 30),
+        ('uk', 'generate_uk', 20),
+        ('germany', 'generate_german', 15),
+        ('france', 'generate_french', 10),
+        ('italy', 'generate_italian', 8),
+        ('belgium', 'generate_belgian', 5),
+        ('netherlands', 'generate_dutch', 5),
+        ('spain', 'generate_spanish', 4),
+        ('australia', 'generate_australian', 2),
+        ('japan', 'generate_japanese', 1),
+    )
+    _REGION_NAMES = tuple(name for name, _, _ in _REGIONS)
+    _REGION_METHODS = {name: method for name, method, _ in _REGIONS}
+    _REGION_CUM_WEIGHTS = tuple(itertools.accumulate(weight for _, _, weight in _REGIONS))
+
     def __init__(self):
         """Initialize the call sign generator with region-specific patterns."""
 
@@ -530,6 +579,9 @@ class CallSignGenerator:
         # Letter pool for suffixes
         self.letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
+        # Shared module-level random source
+        self.random = _rng
+
     def generate_us(self):
         """
         Generate a US amateur radio call sign.
@@ -541,19 +593,17 @@ class CallSignGenerator:
         Returns:
             str: Valid US call sign
         """
-        import random
-
         # 70% chance of 1-letter prefix, 30% chance of 2-letter prefix
-        if random.random() < 0.7:
-            prefix = random.choice(self.us_prefixes_1)
+        if self.random.random() < 0.7:
+            prefix = self.random.choice(self.us_prefixes_1)
         else:
-            prefix = random.choice(self.us_prefixes_2)
+            prefix = self.random.choice(self.us_prefixes_2)
 
-        region = random.choice(self.us_regions)
+        region = self.random.choice(self.us_regions)
 
         # Suffix: 2 or 3 letters (70% 3 letters, 30% 2 letters)
-        suffix_length = 3 if random.random() < 0.7 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.7 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -567,14 +617,12 @@ class CallSignGenerator:
         Returns:
             str: Valid UK call sign
         """
-        import random
-
-        prefix = random.choice(self.uk_prefixes)
-        region = random.choice(self.uk_regions)
+        prefix = self.random.choice(self.uk_prefixes)
+        region = self.random.choice(self.uk_regions)
 
         # Suffix: 2-4 letters (most commonly 3)
-        suffix_length = random.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = self.random.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -588,14 +636,12 @@ class CallSignGenerator:
         Returns:
             str: Valid German call sign
         """
-        import random
-
-        prefix = random.choice(self.german_prefixes)
-        region = random.choice(self.german_regions)
+        prefix = self.random.choice(self.german_prefixes)
+        region = self.random.choice(self.german_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -609,13 +655,11 @@ class CallSignGenerator:
         Returns:
             str: Valid French call sign
         """
-        import random
-
-        region = random.choice(self.french_regions)
+        region = self.random.choice(self.french_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"F{region}{suffix}"
 
@@ -629,13 +673,11 @@ class CallSignGenerator:
         Returns:
             str: Valid Italian call sign
         """
-        import random
-
-        region = random.choice(self.italian_regions)
+        region = self.random.choice(self.italian_regions)
 
         # Suffix: 2-4 letters (mostly 3)
-        suffix_length = random.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = self.random.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"I{region}{suffix}"
 
@@ -649,13 +691,11 @@ class CallSignGenerator:
         Returns:
             str: Valid Belgian call sign
         """
-        import random
-
-        region = random.choice(self.belgian_regions)
+        region = self.random.choice(self.belgian_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"ON{region}{suffix}"
 
@@ -669,14 +709,12 @@ class CallSignGenerator:
         Returns:
             str: Valid Dutch call sign
         """
-        import random
-
-        prefix = random.choice(self.dutch_prefixes)
-        region = random.choice(self.dutch_regions)
+        prefix = self.random.choice(self.dutch_prefixes)
+        region = self.random.choice(self.dutch_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -690,14 +728,12 @@ class CallSignGenerator:
         Returns:
             str: Valid Spanish call sign
         """
-        import random
-
-        prefix = random.choice(self.spanish_prefixes)
-        region = random.choice(self.spanish_regions)
+        prefix = self.random.choice(self.spanish_prefixes)
+        region = self.random.choice(self.spanish_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -711,13 +747,11 @@ class CallSignGenerator:
         Returns:
             str: Valid Australian call sign
         """
-        import random
-
-        region = random.choice(self.vk_regions)
+        region = self.random.choice(self.vk_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"VK{region}{suffix}"
 
@@ -731,14 +765,12 @@ class CallSignGenerator:
         Returns:
             str: Valid Japanese call sign
         """
-        import random
-
-        prefix = random.choice(self.japanese_prefixes)
-        region = random.choice(self.japanese_regions)
+        prefix = self.random.choice(self.japanese_prefixes)
+        region = self.random.choice(self.japanese_regions)
 
         # Suffix: 2 or 3 letters (mostly 3)
-        suffix_length = 3 if random.random() < 0.8 else 2
-        suffix = ''.join(random.choice(self.letters) for _ in range(suffix_length))
+        suffix_length = 3 if self.random.random() < 0.8 else 2
+        suffix = ''.join(self.random.choices(self.letters, k=suffix_length))
 
         return f"{prefix}{region}{suffix}"
 
@@ -756,38 +788,17 @@ class CallSignGenerator:
         Raises:
             ValueError: If invalid region specified
         """
-        import random
-
-        # Map of region names to generator methods
-        region_generators = {
-            'us': self.generate_us,
-            'uk': self.generate_uk,
-            'germany': self.generate_german,
-            'france': self.generate_french,
-            'italy': self.generate_italian,
-            'belgium': self.generate_belgian,
-            'netherlands': self.generate_dutch,
-            'spain': self.generate_spanish,
-            'australia': self.generate_australian,
-            'japan': self.generate_japanese,
-        }
-
         # If no region specified, choose random based on realistic distribution
         if region is None:
-            # Weight distribution to favor US/UK/EU for European user
-            region = random.choices(
-                list(region_generators.keys()),
-                weights=[30, 20, 15, 10, 8, 5, 5, 4, 2, 1],  # US gets most, Japan least
-                k=1
-            )[0]
+            region = self.random.choices(self._REGION_NAMES, cum_weights=self._REGION_CUM_WEIGHTS)[0]
 
         # Validate region
-        if region not in region_generators:
-            valid_regions = ', '.join(region_generators.keys())
+        if region not in self._REGION_METHODS:
+            valid_regions = ', '.join(self._REGION_NAMES)
             raise ValueError(f"Invalid region '{region}'. Valid regions: {valid_regions}")
 
         # Generate and return call sign
-        return region_generators[region]()
+        return getattr(self, self._REGION_METHODS[region])()
 
     def validate_callsign(self, callsign):
         """
@@ -811,22 +822,9 @@ class CallSignGenerator:
         if not (4 <= len(callsign) <= 8):
             return False
 
-        # Must contain at least one digit
-        if not any(c.isdigit() for c in callsign):
-            return False
-
-        # Must contain at least one letter
-        if not any(c.isalpha() for c in callsign):
-            return False
-
-        # Only alphanumeric characters allowed
-        if not callsign.isalnum():
-            return False
-
-        # General pattern: starts with letters, contains digit, ends with letters
-        # This is a simplified check - actual validation would be region-specific
-        import re
-        if not re.match(r'^[A-Z]{1,2}\d[A-Z]{2,4}$', callsign):
+        # General pattern: starts with letters, contains digit, ends with letters.
+        # A single match also enforces the digit, letter and alphanumeric rules.
+        if not CALLSIGN_PATTERN.match(callsign):
             return False
 
         return True
@@ -863,8 +861,7 @@ class QSOTemplate:
 
     def __init__(self):
         """Initialize the template system with predefined templates."""
-        import random
-        self.random = random
+        self.random = _rng
 
     def generate_minimal(self):
         """
@@ -1103,13 +1100,13 @@ class QSOTemplate:
         for var in ['WX1', 'WX2', 'TEMP1', 'TEMP2']:
             if not isinstance(variables[var], str):
                 raise ValueError(f"Invalid {var}: must be string")
-            if not re.match(r'^[A-Z0-9\s\-/]{1,30}$', variables[var].upper().strip()):
+            if not _CONDITION_PATTERN.match(variables[var].upper().strip()):
                 raise ValueError(f"Invalid {var} format: {variables[var]}")
 
         # Perform substitution
         result = template
         for var_name, var_value in variables.items():
-            placeholder = '{' + var_name + '}'
+            placeholder = f'{{{var_name}}}'
             result = result.replace(placeholder, str(var_value).upper().strip())
 
         return result
@@ -1146,18 +1143,16 @@ class QSOGenerator:
         Note: Seeding affects this generator and its component generators
               for reproducible QSO generation.
         """
-        import random
-
         # Store seed for component initialization
         self.seed = seed
 
-        # Initialize random with seed if provided
+        # Initialize the shared random source with seed if provided
         if seed is not None:
-            random.seed(seed)
-        self.random = random
+            _rng.seed(seed)
+        self.random = _rng
 
         # Initialize component generators
-        # Note: Components use the same random module, so seeding above affects them
+        # Note: Components share the same Random instance, so seeding above affects them
         self.call_gen = CallSignGenerator()
         self.template_gen = QSOTemplate()
 
@@ -1453,11 +1448,9 @@ class QSOGenerator:
 
         self.logger.info(f"Generating {count} {verbosity} QSOs")
 
-        qsos = []
-        for i in range(count):
-            qso = self.generate_qso(verbosity=verbosity)
-            qsos.append(qso)
-            self.logger.debug(f"Generated QSO {i+1}/{count}")
+        generate_qso = self.generate_qso
+        qsos = [generate_qso(verbosity=verbosity) for _ in range(count)]
+        self.logger.debug(f"Generated {len(qsos)} QSOs")
 
         return qsos
 
@@ -52,6 +52,9 @@ class QSOPracticeSession:
         session.next_qso()
     """
 
+    # Creates the playback thread; can be overridden per instance
+    _thread_factory = threading.Thread
+
     def __init__(
         self,
         morse_code,  # MorseCode instance for audio playback
@@ -206,7 +209,7 @@ class QSOPracticeSession:
         self._update_state('playing')
 
         # Start playback in separate thread
-        self._playback_thread = threading.Thread(
+        self._playback_thread = self._thread_factory(
             target=self._play_qso_thread,
             daemon=True
         )
@@ -13,6 +13,73 @@ Version: 1.0.0
 from typing import Dict, List, Optional, Tuple
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+
+# Feedback values returned by the score methods
+FEEDBACK_CORRECT = 'correct'
+FEEDBACK_PARTIAL = 'partial'
+FEEDBACK_INCORRECT = 'incorrect'
+
+# Layout of the per-element statistics lists kept by QSOScorer:
+# [total, correct, partial, incorrect, total_score]
+_STAT_TOTAL = 0
+_STAT_INDEX = {FEEDBACK_CORRECT: 1, FEEDBACK_PARTIAL: 2, FEEDBACK_INCORRECT: 3}
+_STAT_SCORE = 4
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str, case_sensitive: bool) -> str:
+    """
+    Normalize text for comparison (cached; answers repeat across a session).
+
+    Args:
+        text: Text to normalize
+        case_sensitive: Whether to preserve case
+
+    Returns:
+        Normalized text
+    """
+    # Collapse whitespace; split() also drops leading/trailing whitespace,
+    # so no separate strip() is needed
+    text = ' '.join(text.split())
+
+    # Handle case sensitivity
+    return text if case_sensitive else text.upper()
+
+
+@lru_cache(maxsize=1024)
+def _similarity(answer: str, correct: str, cutoff: float = 0.0) -> float:
+    """
+    Similarity ratio of two already-normalized strings.
+
+    Single entry point for the fuzzy matcher, so callers that have already
+    normalized their inputs don't pay for normalization twice. Results are
+    cached; statistics are updated by the calling score methods, not here.
+
+    Args:
+        answer: Normalized user answer
+        correct: Normalized correct answer
+        cutoff: Ratios below this are reported as 0.0, letting the cheap
+                upper bounds reject clear mismatches without a full match
+
+    Returns:
+        Similarity ratio (0.0-1.0)
+    """
+    if not answer or not correct:
+        return 0.0
+
+    # Identical strings need no matching blocks computed
+    if answer == correct:
+        return 1.0
+
+    # SequenceMatcher builds matching blocks from an index of `correct`
+    # rather than a full edit-distance table, so memory stays linear
+    matcher = SequenceMatcher(None, answer, correct)
+    if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+        return 0.0
+
+    return matcher.ratio()
 
 
 class QSOScorer:
@@ -51,6 +118,31 @@ class QSOScorer:
         result = scorer.score_qso(user_answers, correct_elements)
     """
 
+    __slots__ = (
+        'fuzzy_threshold', 'partial_credit', 'case_sensitive',
+        'total_questions', 'total_correct', 'total_partial', 'total_incorrect',
+        'element_stats'
+    )
+
+    # Elements scored by score_qso, in order:
+    # (answer key, correct_elements key, index, scoring method, required)
+    _QSO_ELEMENTS = (
+        ('callsign1', 'callsigns', 0, 'score_callsign', True),
+        ('callsign2', 'callsigns', 1, 'score_callsign', True),
+        ('name1', 'names', 0, 'score_element', True),
+        ('name2', 'names', 1, 'score_element', True),
+        ('qth1', 'qths', 0, 'score_element', True),
+        ('qth2', 'qths', 1, 'score_element', True),
+        ('rst1', 'rsts', 0, 'score_rst', True),
+        ('rst2', 'rsts', 1, 'score_rst', True),
+        ('rig1', 'rigs', 0, 'score_element', False),
+        ('rig2', 'rigs', 1, 'score_element', False),
+        ('antenna1', 'antennas', 0, 'score_element', False),
+        ('antenna2', 'antennas', 1, 'score_element', False),
+        ('power1', 'powers', 0, 'score_element', False),
+        ('power2', 'powers', 1, 'score_element', False),
+    )
+
     def __init__(
         self,
         fuzzy_threshold: float = 0.8,
@@ -77,7 +169,7 @@ class QSOScorer:
         self.total_correct = 0
         self.total_partial = 0
         self.total_incorrect = 0
-        self.element_stats = {}  # Per-element type statistics
+        self.element_stats = {}  # Per-element type counters (see _STAT_INDEX)
 
     def _normalize(self, text: str) -> str:
         """
@@ -92,39 +184,7 @@ class QSOScorer:
         if text is None:
             return ''
 
-        # Convert to string
-        text = str(text).strip()
-
-        # Handle case sensitivity
-        if not self.case_sensitive:
-            text = text.upper()
-
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-
-        return text
-
-    def _calculate_similarity(self, answer: str, correct: str) -> float:
-        """
-        Calculate similarity between two strings.
-
-        Uses SequenceMatcher for Levenshtein-like similarity.
-
-        Args:
-            answer: User's answer
-            correct: Correct answer
-
-        Returns:
-            Similarity ratio (0.0-1.0)
-        """
-        answer = self._normalize(answer)
-        correct = self._normalize(correct)
-
-        if not answer or not correct:
-            return 0.0
-
-        # Use SequenceMatcher for fuzzy matching
-        return SequenceMatcher(None, answer, correct).ratio()
+        return _normalize_text(str(text), self.case_sensitive)
 
     def score_element(
         self,
@@ -151,27 +211,27 @@ class QSOScorer:
 
         # Empty answers are incorrect
         if not answer_norm:
-            self._update_stats(element_type, 0.0, 'incorrect')
-            return 0.0, 'incorrect'
+            self._update_stats(element_type, 0.0, FEEDBACK_INCORRECT)
+            return 0.0, FEEDBACK_INCORRECT
 
         # Exact match
         if answer_norm == correct_norm:
-            self._update_stats(element_type, 1.0, 'correct')
-            return 1.0, 'correct'
+            self._update_stats(element_type, 1.0, FEEDBACK_CORRECT)
+            return 1.0, FEEDBACK_CORRECT
 
         # Fuzzy matching
         if self.partial_credit:
-            similarity = self._calculate_similarity(answer, correct)
+            similarity = _similarity(answer_norm, correct_norm, self.fuzzy_threshold)
 
             if similarity >= self.fuzzy_threshold:
                 # Award partial credit based on similarity
                 score = similarity
-                self._update_stats(element_type, score, 'partial')
-                return score, 'partial'
+                self._update_stats(element_type, score, FEEDBACK_PARTIAL)
+                return score, FEEDBACK_PARTIAL
 
         # No match
-        self._update_stats(element_type, 0.0, 'incorrect')
-        return 0.0, 'incorrect'
+        self._update_stats(element_type, 0.0, FEEDBACK_INCORRECT)
+        return 0.0, FEEDBACK_INCORRECT
 
     def score_callsign(self, answer: str, correct: str) -> Tuple[float, str]:
         """
@@ -216,25 +276,26 @@ class QSOScorer:
         correct_norm = self._normalize(correct)
 
         if not answer_norm:
-            self._update_stats('rst', 0.0, 'incorrect')
-            return 0.0, 'incorrect'
+            self._update_stats('rst', 0.0, FEEDBACK_INCORRECT)
+            return 0.0, FEEDBACK_INCORRECT
 
         # Exact match
         if answer_norm == correct_norm:
-            self._update_stats('rst', 1.0, 'correct')
-            return 1.0, 'correct'
+            self._update_stats('rst', 1.0, FEEDBACK_CORRECT)
+            return 1.0, FEEDBACK_CORRECT
 
         # Partial credit for RST
         if self.partial_credit and len(answer_norm) == 3 and len(correct_norm) == 3:
-            matches = sum(a == c for a, c in zip(answer_norm, correct_norm))
+            # Count matching digits in C rather than a generator expression
+            matches = sum(map(str.__eq__, answer_norm, correct_norm))
             score = matches / 3.0
 
             if score >= 0.66:  # At least 2 out of 3 digits
-                self._update_stats('rst', score, 'partial')
-                return score, 'partial'
+                self._update_stats('rst', score, FEEDBACK_PARTIAL)
+                return score, FEEDBACK_PARTIAL
 
-        self._update_stats('rst', 0.0, 'incorrect')
-        return 0.0, 'incorrect'
+        self._update_stats('rst', 0.0, FEEDBACK_INCORRECT)
+        return 0.0, FEEDBACK_INCORRECT
 
     def score_qso(
         self,
@@ -295,38 +356,17 @@ class QSOScorer:
         element_scores = {}
         total_score = 0.0
         max_score = 0
-        correct_count = 0
-        partial_count = 0
-        incorrect_count = 0
-
-        # Define required elements
-        required_elements = [
-            ('callsign1', 'callsigns', 0, self.score_callsign),
-            ('callsign2', 'callsigns', 1, self.score_callsign),
-            ('name1', 'names', 0, self.score_element),
-            ('name2', 'names', 1, self.score_element),
-            ('qth1', 'qths', 0, self.score_element),
-            ('qth2', 'qths', 1, self.score_element),
-            ('rst1', 'rsts', 0, self.score_rst),
-            ('rst2', 'rsts', 1, self.score_rst),
-        ]
-
-        # Optional elements
-        optional_elements = [
-            ('rig1', 'rigs', 0, self.score_element),
-            ('rig2', 'rigs', 1, self.score_element),
-            ('antenna1', 'antennas', 0, self.score_element),
-            ('antenna2', 'antennas', 1, self.score_element),
-            ('power1', 'powers', 0, self.score_element),
-            ('power2', 'powers', 1, self.score_element),
-        ]
-
-        # Score required elements
-        for key, element_type, index, score_func in required_elements:
+        summary = {FEEDBACK_CORRECT: 0, FEEDBACK_PARTIAL: 0, FEEDBACK_INCORRECT: 0}
+
+        # Single pass over the element table; optional elements are only
+        # scored when provided in user answers
+        for key, element_type, index, method_name, required in self._QSO_ELEMENTS:
             answer = user_answers.get(key, '')
-            correct = correct_elements[element_type][index]
+            if not required and not answer:
+                continue
 
-            score, feedback = score_func(answer, correct)
+            correct = correct_elements[element_type][index]
+            score, feedback = getattr(self, method_name)(answer, correct)
 
             element_scores[key] = {
                 'score': score,
@@ -337,38 +377,7 @@ class QSOScorer:
 
             total_score += score
             max_score += 1
-
-            if feedback == 'correct':
-                correct_count += 1
-            elif feedback == 'partial':
-                partial_count += 1
-            else:
-                incorrect_count += 1
-
-        # Score optional elements (only if provided in user answers)
-        for key, element_type, index, score_func in optional_elements:
-            if key in user_answers and user_answers[key]:
-                answer = user_answers[key]
-                correct = correct_elements[element_type][index]
-
-                score, feedback = score_func(answer, correct)
-
-                element_scores[key] = {
-                    'score': score,
-                    'feedback': feedback,
-                    'correct': correct,
-                    'answer': answer
-                }
-
-                total_score += score
-                max_score += 1
-
-                if feedback == 'correct':
-                    correct_count += 1
-                elif feedback == 'partial':
-                    partial_count += 1
-                else:
-                    incorrect_count += 1
+            summary[feedback] += 1
 
         # Calculate percentage
         percentage = (total_score / max_score * 100) if max_score > 0 else 0.0
@@ -378,38 +387,28 @@ class QSOScorer:
             'max_score': max_score,
             'percentage': round(percentage, 1),
             'element_scores': element_scores,
-            'summary': {
-                'correct': correct_count,
-                'partial': partial_count,
-                'incorrect': incorrect_count
-            }
+            'summary': summary
         }
 
     def _update_stats(self, element_type: str, score: float, feedback: str):
         """Update internal statistics."""
         self.total_questions += 1
 
-        if feedback == 'correct':
+        if feedback == FEEDBACK_CORRECT:
             self.total_correct += 1
-        elif feedback == 'partial':
+        elif feedback == FEEDBACK_PARTIAL:
             self.total_partial += 1
         else:
             self.total_incorrect += 1
 
-        # Per-element stats
-        if element_type not in self.element_stats:
-            self.element_stats[element_type] = {
-                'total': 0,
-                'correct': 0,
-                'partial': 0,
-                'incorrect': 0,
-                'total_score': 0.0
-            }
+        # Per-element stats: flat [total, correct, partial, incorrect, total_score]
+        stats = self.element_stats.get(element_type)
+        if stats is None:
+            stats = self.element_stats[element_type] = [0, 0, 0, 0, 0.0]
 
-        stats = self.element_stats[element_type]
-        stats['total'] += 1
-        stats[feedback] += 1
-        stats['total_score'] += score
+        stats[_STAT_TOTAL] += 1
+        stats[_STAT_INDEX[feedback]] += 1
+        stats[_STAT_SCORE] += score
 
     def get_statistics(self) -> Dict:
         """
@@ -440,15 +439,15 @@ class QSOScorer:
         # Calculate per-element statistics
         by_element = {}
         for element_type, stats in self.element_stats.items():
-            total = stats['total']
-            accuracy = (stats['correct'] / total * 100) if total > 0 else 0.0
-            avg_score = (stats['total_score'] / total) if total > 0 else 0.0
+            total, correct, partial, incorrect, total_score = stats
+            accuracy = (correct / total * 100) if total > 0 else 0.0
+            avg_score = (total_score / total) if total > 0 else 0.0
 
             by_element[element_type] = {
                 'total': total,
-                'correct': stats['correct'],
-                'partial': stats['partial'],
-                'incorrect': stats['incorrect'],
+                'correct': correct,
+                'partial': partial,
+                'incorrect': incorrect,
                 'accuracy': round(accuracy, 1),
                 'average_score': round(avg_score, 2)
             }
@@ -480,6 +479,8 @@ class SessionScorer:
     Manages multiple QSO scores and provides session-level statistics.
     """
 
+    __slots__ = ('scorer', 'qso_scores', 'session_start_time', 'session_end_time')
+
     def __init__(self, scorer: Optional[QSOScorer] = None):
         """
         Initialize session scorer.
@@ -526,8 +527,13 @@ class SessionScorer:
                 'element_statistics': {}
             }
 
-        total_score = sum(q['total_score'] for q in self.qso_scores)
-        max_score = sum(q['max_score'] for q in self.qso_scores)
+        # Accumulate both totals in a single pass over the QSO scores
+        total_score = 0.0
+        max_score = 0
+        for qso_score in self.qso_scores:
+            total_score += qso_score['total_score']
+            max_score += qso_score['max_score']
+
         average_percentage = (total_score / max_score * 100) if max_score > 0 else 0.0
 
         return {
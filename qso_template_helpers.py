@@ -0,0 +1,50 @@
+"""
+Shared helpers for the QSOTemplate test modules
+
+Used by test_qso_template.py and test_qso_template_substitution.py, so
+neither test module has to import the other.
+
+Author: Generated with Claude Code
+Date: 2025-11-28
+Issue: #4 - QSO Feature: Template System
+"""
+
+import re
+from functools import lru_cache
+from qso_data import QSOTemplate
+
+
+# Matches a {NAME} placeholder, capturing the variable name
+PLACEHOLDER_RE = re.compile(r'\{([A-Z0-9]+)\}')
+
+
+def placeholders(text):
+    """Return the set of placeholder names in a template, found in one scan."""
+    return frozenset(PLACEHOLDER_RE.findall(text))
+
+
+class _VariantPicker:
+    """Stand-in for QSOTemplate.random whose choice() returns a fixed index."""
+
+    def __init__(self):
+        self.index = 0
+        self.variant_count = 1
+
+    def choice(self, templates):
+        self.variant_count = len(templates)
+        return templates[self.index]
+
+
+@lru_cache(maxsize=None)
+def template_pool(verbosity):
+    """Every template variant of a verbosity level, built once and shared by every test."""
+    template = QSOTemplate()
+    # Walk the variants in order instead of sampling them, so every one is
+    # checked and the shared qso_data RNG is left untouched
+    picker = template.random = _VariantPicker()
+    generate = getattr(template, f'generate_{verbosity}')
+    pool = [generate()]
+    for index in range(1, picker.variant_count):
+        picker.index = index
+        pool.append(generate())
+    return tuple(pool)
@@ -69,10 +69,9 @@ class TestUSCallSignGeneration(unittest.TestCase):
         for _ in range(200):
             callsign = self.gen.generate_us()
             # Extract region digit
-            for char in callsign:
-                if char.isdigit():
-                    regions_used.add(char)
-                    break
+            regions_used.add(next(filter(str.isdigit, callsign)))
+            if len(regions_used) >= 8:
+                break
 
         # Should use most regions (at least 8 out of 10)
         self.assertGreaterEqual(len(regions_used), 8)
@@ -98,6 +97,8 @@ class TestUKCallSignGeneration(unittest.TestCase):
         for _ in range(100):
             callsign = self.gen.generate_uk()
             prefixes_used.add(callsign[0])
+            if len(prefixes_used) == 2:
+                break
 
         self.assertIn('G', prefixes_used)
         self.assertIn('M', prefixes_used)
@@ -273,14 +274,15 @@ class TestValidateCallsign(unittest.TestCase):
 class TestCallSignFormats(unittest.TestCase):
     """Test that call signs follow realistic patterns."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = CallSignGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Generate one shared batch of call signs for all format checks."""
+        gen = CallSignGenerator()
+        cls.callsigns = [gen.generate() for _ in range(100)]
 
     def test_callsign_length(self):
         """Test that generated call signs have realistic lengths."""
-        for _ in range(100):
-            callsign = self.gen.generate()
+        for callsign in self.callsigns:
             self.assertGreaterEqual(len(callsign), 4,
                                    f"'{callsign}' too short")
             self.assertLessEqual(len(callsign), 8,
@@ -288,22 +290,19 @@ class TestCallSignFormats(unittest.TestCase):
 
     def test_callsign_has_digit(self):
         """Test that all call signs contain at least one digit."""
-        for _ in range(100):
-            callsign = self.gen.generate()
+        for callsign in self.callsigns:
             self.assertTrue(any(c.isdigit() for c in callsign),
                           f"'{callsign}' should contain a digit")
 
     def test_callsign_uppercase(self):
         """Test that all call signs are uppercase."""
-        for _ in range(100):
-            callsign = self.gen.generate()
+        for callsign in self.callsigns:
             self.assertEqual(callsign, callsign.upper(),
                            f"'{callsign}' should be uppercase")
 
     def test_callsign_alphanumeric(self):
         """Test that call signs only contain alphanumeric characters."""
-        for _ in range(100):
-            callsign = self.gen.generate()
+        for callsign in self.callsigns:
             self.assertTrue(callsign.isalnum(),
                           f"'{callsign}' should be alphanumeric only")
 
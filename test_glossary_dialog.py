@@ -5,6 +5,7 @@ Quick test to verify the abbreviation glossary dialog works.
 This script launches just the glossary dialog for visual testing.
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk
 from qso_data import ABBREVIATIONS, ABBREVIATION_CATEGORIES
@@ -72,7 +73,8 @@ def show_abbreviation_glossary(root):
     tree.column('Meaning', width=350, anchor=tk.W)
     tree.column('Category', width=150, anchor=tk.W)
 
-    # Find category for each abbreviation
+    # Find category for each abbreviation (cached across display updates)
+    @functools.lru_cache(maxsize=None)
     def get_category(abbr):
         for category, abbrs in ABBREVIATION_CATEGORIES.items():
             if abbr in abbrs:
@@ -81,9 +83,8 @@ def show_abbreviation_glossary(root):
 
     # Populate tree
     def update_display(*args):
-        # Clear tree
-        for item in tree.get_children():
-            tree.delete(item)
+        # Clear tree in a single Tcl call
+        tree.delete(*tree.get_children())
 
         search_text = search_var.get().upper()
         selected_category = category_var.get()
@@ -115,9 +116,26 @@ def show_abbreviation_glossary(root):
     status_label = ttk.Label(status_frame, text="")
     status_label.pack(side=tk.LEFT)
 
+    # Debounce search updates so a burst of keystrokes rebuilds once
+    pending_update = [None]
+
+    def schedule_update(*args):
+        if pending_update[0] is not None:
+            glossary_window.after_cancel(pending_update[0])
+        pending_update[0] = glossary_window.after(150, update_display)
+
+    def cancel_pending_update(event):
+        # <Destroy> also fires for each child widget; only act on the window
+        # itself, so a queued update never runs against a destroyed Treeview
+        if event.widget is glossary_window and pending_update[0] is not None:
+            glossary_window.after_cancel(pending_update[0])
+            pending_update[0] = None
+
+    glossary_window.bind('<Destroy>', cancel_pending_update, add='+')
+
     # Bind search updates
-    search_var.trace('w', update_display)
-    category_var.trace('w', update_display)
+    search_var.trace('w', schedule_update)
+    category_var.trace('w', schedule_update)
 
     # Initial display
     update_display()
@@ -11,39 +11,120 @@ Tests the actual GUI widgets and interactions, including:
 Run with: python -m pytest test_gui_qso_practice.py -v
 """
 
+import os
+import sys
 import unittest
 import tkinter as tk
+from tkinter import ttk
 from unittest.mock import MagicMock, patch, PropertyMock
-import time
 import threading
-from morse import MorseCode
-from morse_gui import MorseCodeGUI
 
+try:
+    from morse import MorseCode
+    from morse_gui import MorseCodeGUI
+    _GUI_IMPORTABLE = True
+except ImportError:
+    # GUI dependencies (pyaudio/numpy) not installed
+    _GUI_IMPORTABLE = False
 
-class TestQSOPracticeGUI(unittest.TestCase):
+
+def _display_available():
+    """Check if a display is available for creating Tk windows"""
+    if sys.platform in ('darwin', 'win32'):
+        return True
+    return bool(os.environ.get('DISPLAY'))
+
+
+GUI_AVAILABLE = _GUI_IMPORTABLE and _display_available()
+
+# Skip GUI tests gracefully when there is no display or GUI dependencies are missing
+requires_gui = unittest.skipUnless(GUI_AVAILABLE, "GUI display or dependencies not available")
+
+# QSO tab entry fields every session must expose
+EXPECTED_FIELDS = frozenset({'callsign1', 'callsign2', 'name1', 'name2', 'qth1', 'qth2'})
+
+
+# Mock pyaudio once for the whole module to avoid actual audio initialization.
+# The audio stream mock is built once and handed out by every open() call.
+_pyaudio_patcher = patch('morse.pyaudio.PyAudio')
+_mock_stream = MagicMock()
+
+
+def setUpModule():
+    """Start the module-wide pyaudio mock"""
+    if not GUI_AVAILABLE:
+        return
+    mock_pyaudio = _pyaudio_patcher.start()
+    mock_pyaudio.return_value.open.return_value = _mock_stream
+
+
+def tearDownModule():
+    """Stop the module-wide pyaudio mock"""
+    if GUI_AVAILABLE:
+        _pyaudio_patcher.stop()
+
+
+@requires_gui
+class GUITestCase(unittest.TestCase):
+    """Base class sharing a single Tk root across all tests in a class"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared Tk root (hidden; each test gets its own window)"""
+        cls.tk_root = tk.Tk()
+        cls.tk_root.withdraw()
+
+        # Silence audio playback once for the whole class
+        cls._play_string_patcher = patch.object(MorseCode, 'play_string', return_value=None)
+        cls._play_string_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Destroy the shared Tk root"""
+        cls._play_string_patcher.stop()
+        try:
+            cls.tk_root.destroy()
+        except tk.TclError:
+            pass
+
+    def run_until(self, condition, timeout=1.0):
+        """Run the Tk event loop until condition() is true or timeout expires"""
+        timeout_id = self.tk_root.after(int(timeout * 1000), self.tk_root.quit)
+
+        def check_done():
+            if condition():
+                self.tk_root.quit()
+            else:
+                self.tk_root.after(10, check_done)
+
+        # Running mainloop (rather than sleeping) lets scheduled callbacks and
+        # the playback thread's widget updates be dispatched on the main thread
+        self.tk_root.after_idle(check_done)
+        self.tk_root.mainloop()
+        self.tk_root.after_cancel(timeout_id)
+
+    def wait_for_playback(self):
+        """Run the Tk event loop until the current playback thread finishes"""
+        self.run_until(lambda: not self.gui.qso_session.is_playback_active())
+
+
+class TestQSOPracticeGUI(GUITestCase):
     """Test QSO Practice GUI interactions"""
 
     def setUp(self):
         """Create GUI instance for testing"""
-        # Create root window
-        self.root = tk.Tk()
+        # Create a window on the shared root
+        self.root = tk.Toplevel(self.tk_root)
 
-        # Mock pyaudio to avoid actual audio initialization
-        with patch('morse.pyaudio.PyAudio') as mock_pyaudio:
-            # Configure the mock
-            mock_audio_instance = MagicMock()
-            mock_pyaudio.return_value = mock_audio_instance
-            mock_audio_instance.open.return_value = MagicMock()
+        # Create GUI (pyaudio is mocked at module scope)
+        self.gui = MorseCodeGUI(self.root)
 
-            # Create GUI
-            self.gui = MorseCodeGUI(self.root)
-
-        # Give GUI time to initialize
-        self.root.update()
+        # Let GUI finish pending layout
+        self.root.update_idletasks()
 
         # Switch to QSO Practice tab
         self.gui.notebook.select(3)  # QSO Practice is tab 3
-        self.root.update()
+        self.root.update_idletasks()
 
     def tearDown(self):
         """Clean up after each test"""
@@ -51,9 +132,8 @@ class TestQSOPracticeGUI(unittest.TestCase):
             if hasattr(self, 'gui') and hasattr(self.gui, 'qso_session'):
                 if self.gui.qso_session:
                     self.gui.qso_session.stop_playback()
-            self.root.quit()
             self.root.destroy()
-        except:
+        except tk.TclError:
             pass
 
     def test_gui_initializes(self):
@@ -61,233 +141,182 @@ class TestQSOPracticeGUI(unittest.TestCase):
         self.assertIsNotNone(self.gui)
         self.assertIsNotNone(self.root)
 
-    def test_initial_button_states(self):
-        """Test initial state of QSO buttons"""
-        # Play button doubles as start session - should be enabled
-        self.assertEqual(str(self.gui.qso_play_button['state']), 'normal')
-
-        # Submit button should be disabled initially
-        self.assertEqual(str(self.gui.qso_submit_button['state']), 'disabled')
-
-    def test_entry_fields_disabled_initially(self):
-        """Test entry fields are disabled before session starts"""
-        for entry in self.gui.qso_entry_widgets.values():
-            # Should be disabled initially
-            self.assertEqual(str(entry['state']), 'disabled')
-
-    def test_start_session_button(self):
-        """Test clicking Start Session button"""
-        # Mock the QSO session creation
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            # Click start session
-            self.gui.start_qso_session()
-            self.root.update()
+    QSO_BUTTONS = ('qso_play_button', 'qso_replay_button', 'qso_skip_button',
+                   'qso_stop_button', 'qso_submit_button')
+    QSO_ENTRY_FIELDS = ('callsign1', 'callsign2', 'name1', 'name2', 'qth1', 'qth2',
+                        'rst1', 'rst2', 'rig1', 'rig2', 'antenna1', 'antenna2',
+                        'power1', 'power2')
+
+    # Snapshot of a freshly built QSO tab: only the play button (which doubles
+    # as start session) is enabled; every other button and entry is disabled
+    INITIAL_WIDGET_STATES = {
+        **dict.fromkeys(QSO_BUTTONS, 'disabled'),
+        **dict.fromkeys(QSO_ENTRY_FIELDS, 'disabled'),
+        'qso_play_button': 'normal',
+    }
+
+    # Expected widget states after the session starts:
+    # (phase, widget attribute, expected state). Dict attributes hold entries.
+    WIDGET_STATES = (
+        # Play button stays enabled (changes to Play QSO)
+        ('started', 'qso_play_button', 'normal'),
+        # CRITICAL BUG FIX: entry fields and submit must be enabled once playback starts
+        ('playback', 'qso_entry_widgets', 'normal'),
+        ('playback', 'qso_submit_button', 'normal'),
+        # Replay and skip enabled during playback (bugs we fixed)
+        ('playback', 'qso_replay_button', 'normal'),
+        ('playback', 'qso_skip_button', 'normal'),
+    )
+
+    def widget_state_snapshot(self):
+        """Return the current state of every QSO button and entry field"""
+        snapshot = {name: str(getattr(self.gui, name)['state']) for name in self.QSO_BUTTONS}
+        snapshot.update(
+            (key, str(entry['state'])) for key, entry in self.gui.qso_entry_widgets.items()
+        )
+        return snapshot
 
-            # Session should be created
-            self.assertIsNotNone(self.gui.qso_session)
+    def start_playback(self):
+        """Play the current QSO and wait for the mocked playback to finish"""
+        self.gui.play_current_qso()
+        self.wait_for_playback()
 
-            # Play button should now be enabled (changes to Play QSO)
-            self.assertEqual(str(self.gui.qso_play_button['state']), 'normal')
+    def test_widget_states(self):
+        """Test QSO button and entry states before, at start of, and during a session"""
+        self.assertEqual(self.widget_state_snapshot(), self.INITIAL_WIDGET_STATES)
 
-    def test_entry_fields_enabled_during_playback(self):
-        """
-        CRITICAL BUG FIX TEST: Entry fields should be enabled when playback starts
-        This tests the fix we implemented today
-        """
-        # Start a session
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
-            
-            # Start playback
-            self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
-            
-            # Entry fields should be enabled during playback
-            for entry in self.gui.qso_entry_widgets.values():
-                state = str(entry['state'])
-                self.assertIn(state, ['normal', '!disabled'], 
-                    f"Entry field should be enabled during playback, got: {state}")
+        phases = (
+            ('started', self.gui.start_qso_session),
+            ('playback', self.start_playback),
+        )
 
-    def test_submit_button_enabled_during_playback(self):
-        """
-        CRITICAL BUG FIX TEST: Submit button should be enabled during playback
-        This tests the fix we implemented today
-        """
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
+        for phase, advance in phases:
+            advance()
+            self.root.update_idletasks()
 
-            # Start playback
-            self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
+            for case_phase, name, expected in self.WIDGET_STATES:
+                if case_phase != phase:
+                    continue
+                widget = getattr(self.gui, name)
+                widgets = widget.values() if isinstance(widget, dict) else (widget,)
+                with self.subTest(phase=phase, widget=name):
+                    for w in widgets:
+                        self.assertEqual(str(w['state']), expected)
 
-            # Submit button should be enabled
-            self.assertEqual(str(self.gui.qso_submit_button['state']), 'normal')
+            if phase == 'started':
+                # Session should be created
+                self.assertIsNotNone(self.gui.qso_session)
 
     def test_pause_button_functionality(self):
         """Test pause button changes state correctly"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
-
-            # Start playback
-            self.gui.play_current_qso()
-            self.root.update()
-
-            # Button should show "Pause" (with emoji)
-            button_text = self.gui.qso_play_button['text']
-            self.assertIn('Pause', button_text)
-
-            # Manually set session to playing state (since mock completes instantly)
-            if self.gui.qso_session:
-                self.gui.qso_session._update_state('playing')
-
-            # Click to pause
-            self.gui.toggle_qso_playback()
-            self.root.update()
-
-            # Button should show "Resume"
-            button_text = self.gui.qso_play_button['text']
-            self.assertIn('Resume', button_text)
-
-    def test_replay_button_enabled_during_playback(self):
-        """Test replay button is enabled during playback (bug we fixed)"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
+        self.gui.start_qso_session()
+        self.root.update_idletasks()
 
-            self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
+        # Start playback
+        self.gui.play_current_qso()
+        self.root.update_idletasks()
 
-            # Replay button should be enabled
-            self.assertEqual(str(self.gui.qso_replay_button['state']), 'normal')
+        # Button should show "Pause" (with emoji)
+        button_text = self.gui.qso_play_button['text']
+        self.assertIn('Pause', button_text)
 
-    def test_skip_button_enabled_during_playback(self):
-        """Test skip button is enabled during playback (bug we fixed)"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
+        # Manually set session to playing state (since mock completes instantly)
+        if self.gui.qso_session:
+            self.gui.qso_session._update_state('playing')
 
-            self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
+        # Click to pause
+        self.gui.toggle_qso_playback()
+        self.root.update_idletasks()
 
-            # Skip button should be enabled
-            self.assertEqual(str(self.gui.qso_skip_button['state']), 'normal')
+        # Button should show "Resume"
+        button_text = self.gui.qso_play_button['text']
+        self.assertIn('Resume', button_text)
 
     def test_entry_fields_accept_input(self):
         """Test that entry fields accept user input during playback"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
-            
-            self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
-            
-            # Try to type in first entry field
-            first_entry = list(self.gui.qso_entry_widgets.values())[0]
-            first_var = list(self.gui.qso_entry_vars.values())[0]
-            
-            # Set a value
-            first_var.set('TEST123')
-            self.root.update()
-            
-            # Verify it was set
-            self.assertEqual(first_var.get(), 'TEST123')
+        self.gui.start_qso_session()
+        self.root.update_idletasks()
+        
+        self.start_playback()
+        
+        # Try to type in first entry field
+        first_entry = list(self.gui.qso_entry_widgets.values())[0]
+        first_var = list(self.gui.qso_entry_vars.values())[0]
+        
+        # Set a value
+        first_var.set('TEST123')
+        self.root.update_idletasks()
+        
+        # Verify it was set
+        self.assertEqual(first_var.get(), 'TEST123')
 
     def test_submit_during_playback(self):
         """
         CRITICAL BUG FIX TEST: Submitting during playback should work
         This was the main bug we fixed today
         """
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
-            
+        self.gui.start_qso_session()
+        self.root.update_idletasks()
+
+        # Hold playback open so the session is genuinely playing at submit time
+        playback_gate = threading.Event()
+        self.addCleanup(playback_gate.set)
+        with patch.object(MorseCode, 'play_string', side_effect=lambda text: playback_gate.wait(1.0)):
             self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
-            
-            # Fill in some answers
-            for var in self.gui.qso_entry_vars.values():
-                var.set('TEST')
-            
-            # Submit while playing - should not crash
-            try:
+            self.root.update_idletasks()
+            self.assertEqual(self.gui.qso_session.state, 'playing')
+
+            # Fill in some answers with a single Tcl command
+            var_names = tuple(str(var) for var in self.gui.qso_entry_vars.values())
+            self.root.tk.call('foreach', 'name', var_names, 'set $name TEST')
+
+            # Submit while playing - should not crash (errors surface via showerror)
+            with patch('morse_gui.messagebox.showerror') as mock_showerror, \
+                 patch.object(self.root, 'after') as mock_after:
                 self.gui.submit_qso_answer()
-                self.root.update()
-                time.sleep(0.3)  # Wait for submission to process
-                success = True
-            except Exception as e:
-                success = False
-                error = str(e)
-            
-            self.assertTrue(success, f"Submit during playback failed: {error if not success else ''}")
+
+                # Playback is stopped and the session moves straight to transcribing,
+                # with the actual scoring deferred
+                self.assertEqual(self.gui.qso_session.state, 'transcribing')
+                mock_after.assert_called_once()
+                delay, deferred_submit = mock_after.call_args.args
+
+                # Run the deferred submission now instead of waiting for it
+                playback_gate.set()
+                deferred_submit()
+
+                mock_showerror.assert_not_called()
+            self.assertEqual(self.gui.qso_session.current_qso_index, 1)
 
     def test_instructions_text_updates(self):
         """Test that instruction text updates correctly"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
+        self.gui.start_qso_session()
+        self.root.update_idletasks()
+        
+        # Start playback
+        self.start_playback()
+        
+        # Instructions should mention submitting anytime
+        instructions = self.gui.qso_instructions['text']
+        self.assertIn('submit', instructions.lower())
+
+    def test_stop_session_button(self):
+        """Test stop session functionality"""
+        # Mock messagebox to auto-confirm
+        with patch('morse_gui.messagebox.askyesno', return_value=True):
             self.gui.start_qso_session()
-            self.root.update()
+            self.root.update_idletasks()
             
-            # Start playback
             self.gui.play_current_qso()
-            self.root.update()
-            time.sleep(0.1)
+            self.root.update_idletasks()
             
-            # Instructions should mention submitting anytime
-            instructions = self.gui.qso_instructions['text']
-            self.assertIn('submit', instructions.lower())
-
-    def test_stop_session_button(self):
-        """Test stop session functionality"""
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            # Mock messagebox to auto-confirm
-            with patch('morse_gui.messagebox.askyesno', return_value=True):
-                self.gui.start_qso_session()
-                self.root.update()
-                
-                self.gui.play_current_qso()
-                self.root.update()
-                
-                # Stop session
-                self.gui.stop_qso_session()
-                self.root.update()
-                
-                # Session should be reset or None
-                if self.gui.qso_session:
-                    self.assertIn(self.gui.qso_session.state, ['ready', 'stopped'])
-
-
-class TestGUIStatePersistence(unittest.TestCase):
-    """Test that GUI state persists correctly"""
-
-    def setUp(self):
-        self.root = tk.Tk()
-        # Mock pyaudio to avoid actual audio initialization
-        with patch('morse.pyaudio.PyAudio') as mock_pyaudio:
-            mock_audio_instance = MagicMock()
-            mock_pyaudio.return_value = mock_audio_instance
-            mock_audio_instance.open.return_value = MagicMock()
-            self.gui = MorseCodeGUI(self.root)
-        self.root.update()
-        self.gui.notebook.select(3)
-        self.root.update()
-
-    def tearDown(self):
-        try:
-            if hasattr(self, 'gui') and hasattr(self.gui, 'qso_session'):
-                if self.gui.qso_session:
-                    self.gui.qso_session.stop_playback()
-            self.root.quit()
-            self.root.destroy()
-        except:
-            pass
+            # Stop session
+            self.gui.stop_qso_session()
+            self.root.update_idletasks()
+            
+            # Session should be reset or None
+            if self.gui.qso_session:
+                self.assertIn(self.gui.qso_session.state, ['ready', 'stopped'])
 
     def test_configuration_persists(self):
         """Test that configuration changes persist"""
@@ -296,33 +325,31 @@ class TestGUIStatePersistence(unittest.TestCase):
         self.gui.qso_config_verbosity = 'chatty'
 
         # Start session with those settings
-        with patch.object(self.gui.morse, 'play_string', return_value=None):
-            self.gui.start_qso_session()
-            self.root.update()
+        self.gui.start_qso_session()
+        self.root.update_idletasks()
 
-            # Verify session uses those settings (actual attribute is qso_count, not total_qsos)
-            self.assertEqual(self.gui.qso_session.qso_count, 10)
-            self.assertEqual(self.gui.qso_session.verbosity, 'chatty')
+        # Verify session uses those settings (actual attribute is qso_count, not total_qsos)
+        self.assertEqual(self.gui.qso_session.qso_count, 10)
+        self.assertEqual(self.gui.qso_session.verbosity, 'chatty')
 
 
-class TestGUIWidgetReferences(unittest.TestCase):
+class TestGUIWidgetReferences(GUITestCase):
     """Test that GUI has correct widget references"""
 
     def setUp(self):
-        self.root = tk.Tk()
-        # Mock pyaudio to avoid actual audio initialization
-        with patch('morse.pyaudio.PyAudio') as mock_pyaudio:
-            mock_audio_instance = MagicMock()
-            mock_pyaudio.return_value = mock_audio_instance
-            mock_audio_instance.open.return_value = MagicMock()
+        self.root = tk.Toplevel(self.tk_root)
+        # Skip full GUI construction (audio, other tabs); only the QSO tab
+        # widgets are under test here
+        with patch.object(MorseCodeGUI, '__init__', return_value=None):
             self.gui = MorseCodeGUI(self.root)
-        self.root.update()
+        self.gui.root = self.root
+        self.gui.qso_frame = ttk.Frame(self.root)
+        self.gui.create_qso_tab()
 
     def tearDown(self):
         try:
-            self.root.quit()
             self.root.destroy()
-        except:
+        except tk.TclError:
             pass
 
     def test_all_qso_buttons_exist(self):
@@ -340,9 +367,7 @@ class TestGUIWidgetReferences(unittest.TestCase):
         self.assertGreater(len(self.gui.qso_entry_widgets), 0)
 
         # Check expected fields exist (actual field names from GUI)
-        expected_fields = ['callsign1', 'callsign2', 'name1', 'name2', 'qth1', 'qth2']
-        for field in expected_fields:
-            self.assertIn(field, self.gui.qso_entry_widgets)
+        self.assertLessEqual(EXPECTED_FIELDS, self.gui.qso_entry_widgets.keys())
 
     def test_entry_vars_dictionary_populated(self):
         """Test that entry vars dictionary is populated"""
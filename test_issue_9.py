@@ -13,6 +13,37 @@ Tests the abbreviation glossary functionality including:
 import unittest
 from qso_data import ABBREVIATIONS, ABBREVIATION_CATEGORIES
 
+# Glossary sizes and category names, computed once for all tests
+ABBREVIATION_COUNT = len(ABBREVIATIONS)
+CATEGORY_NAMES = frozenset(ABBREVIATION_CATEGORIES)
+
+# Reverse index (abbreviation -> category), built once for all tests.
+# Iterating categories in reverse keeps the first matching category,
+# mirroring the dialog's linear lookup.
+CATEGORY_BY_ABBREVIATION = {
+    abbr: category
+    for category, abbrs in reversed(list(ABBREVIATION_CATEGORIES.items()))
+    for abbr in abbrs
+}
+
+# Glossary rows with uppercased search keys precomputed:
+# (abbr, meaning, category, abbr_upper, meaning_upper)
+GLOSSARY_ROWS = tuple(
+    (abbr, meaning, CATEGORY_BY_ABBREVIATION.get(abbr, "Other"), abbr.upper(), meaning.upper())
+    for abbr, meaning in ABBREVIATIONS.items()
+)
+
+# Category names the glossary dialog expects
+EXPECTED_CATEGORIES = frozenset({
+    'greetings',
+    'friendly',
+    'common_phrases',
+    'technical',
+    'q_codes',
+    'prosigns',
+    'signal_quality'
+})
+
 
 class TestAbbreviationData(unittest.TestCase):
     """Test abbreviation data structure"""
@@ -20,8 +51,8 @@ class TestAbbreviationData(unittest.TestCase):
     def test_abbreviations_exist(self):
         """Test that abbreviations dictionary exists and is populated"""
         self.assertIsInstance(ABBREVIATIONS, dict)
-        self.assertGreater(len(ABBREVIATIONS), 0)
-        self.assertEqual(len(ABBREVIATIONS), 62, "Expected 62 abbreviations")
+        self.assertGreater(ABBREVIATION_COUNT, 0)
+        self.assertEqual(ABBREVIATION_COUNT, 62, "Expected 62 abbreviations")
 
     def test_categories_exist(self):
         """Test that categories dictionary exists"""
@@ -31,19 +62,7 @@ class TestAbbreviationData(unittest.TestCase):
 
     def test_category_names(self):
         """Test expected category names"""
-        expected_categories = [
-            'greetings',
-            'friendly',
-            'common_phrases',
-            'technical',
-            'q_codes',
-            'prosigns',
-            'signal_quality'
-        ]
-        self.assertEqual(
-            set(ABBREVIATION_CATEGORIES.keys()),
-            set(expected_categories)
-        )
+        self.assertEqual(CATEGORY_NAMES, EXPECTED_CATEGORIES)
 
     def test_abbreviations_have_meanings(self):
         """Test all abbreviations have non-empty meanings"""
@@ -75,10 +94,7 @@ class TestAbbreviationCategorization(unittest.TestCase):
 
     def get_category(self, abbr):
         """Helper to find category for abbreviation"""
-        for category, abbrs in ABBREVIATION_CATEGORIES.items():
-            if abbr in abbrs:
-                return category
-        return "Other"
+        return CATEGORY_BY_ABBREVIATION.get(abbr, "Other")
 
     def test_common_abbreviations_categorized(self):
         """Test that common abbreviations have categories"""
@@ -105,14 +121,13 @@ class TestAbbreviationCategorization(unittest.TestCase):
 
     def test_no_duplicate_categorization(self):
         """Test that no abbreviation appears in multiple categories"""
-        all_categorized = []
-        for abbrs in ABBREVIATION_CATEGORIES.values():
-            all_categorized.extend(abbrs)
+        total = sum(len(abbrs) for abbrs in ABBREVIATION_CATEGORIES.values())
+        unique = {abbr for abbrs in ABBREVIATION_CATEGORIES.values() for abbr in abbrs}
 
         # Check for duplicates
         self.assertEqual(
-            len(all_categorized),
-            len(set(all_categorized)),
+            total,
+            len(unique),
             "Some abbreviations appear in multiple categories"
         )
 
@@ -122,15 +137,14 @@ class TestAbbreviationCategorization(unittest.TestCase):
         for abbrs in ABBREVIATION_CATEGORIES.values():
             categorized.update(abbrs)
 
-        coverage = len(categorized) / len(ABBREVIATIONS) * 100
-        print(f"\nCategorization coverage: {coverage:.1f}%")
-        print(f"Categorized: {len(categorized)}/{len(ABBREVIATIONS)}")
+        coverage = len(categorized) / ABBREVIATION_COUNT * 100
 
         # Should have reasonable coverage (at least 70%)
         self.assertGreaterEqual(
             coverage,
             70.0,
-            "Less than 70% of abbreviations are categorized"
+            f"Less than 70% of abbreviations are categorized "
+            f"({len(categorized)}/{ABBREVIATION_COUNT}, {coverage:.1f}%)"
         )
 
 
@@ -139,35 +153,21 @@ class TestSearchFiltering(unittest.TestCase):
 
     def filter_abbreviations(self, search_text="", category="All"):
         """Simulate filtering logic from the dialog"""
-        def get_category(abbr):
-            for cat, abbrs in ABBREVIATION_CATEGORIES.items():
-                if abbr in abbrs:
-                    return cat
-            return "Other"
-
-        results = []
         search_upper = search_text.upper()
 
-        for abbr, meaning in ABBREVIATIONS.items():
-            cat = get_category(abbr)
-
+        return [
+            (abbr, meaning, cat)
+            for abbr, meaning, cat, abbr_upper, meaning_upper in GLOSSARY_ROWS
             # Category filter
-            if category != "All" and cat != category:
-                continue
-
+            if category == "All" or cat == category
             # Search filter
-            if search_upper:
-                if search_upper not in abbr.upper() and search_upper not in meaning.upper():
-                    continue
-
-            results.append((abbr, meaning, cat))
-
-        return results
+            if not search_upper or search_upper in abbr_upper or search_upper in meaning_upper
+        ]
 
     def test_no_filters_returns_all(self):
         """Test that no filters returns all abbreviations"""
         results = self.filter_abbreviations()
-        self.assertEqual(len(results), len(ABBREVIATIONS))
+        self.assertEqual(len(results), ABBREVIATION_COUNT)
 
     def test_search_by_abbreviation(self):
         """Test searching by abbreviation text"""
@@ -217,7 +217,7 @@ class TestSearchFiltering(unittest.TestCase):
     def test_empty_search_returns_all(self):
         """Test that empty search returns all results"""
         results = self.filter_abbreviations(search_text="")
-        self.assertEqual(len(results), len(ABBREVIATIONS))
+        self.assertEqual(len(results), ABBREVIATION_COUNT)
 
 
 def _can_import_gui():
@@ -257,38 +257,5 @@ class TestGlossaryIntegration(unittest.TestCase):
         )
 
 
-def run_tests():
-    """Run all tests and print summary"""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestAbbreviationData))
-    suite.addTests(loader.loadTestsFromTestCase(TestAbbreviationCategorization))
-    suite.addTests(loader.loadTestsFromTestCase(TestSearchFiltering))
-    suite.addTests(loader.loadTestsFromTestCase(TestGlossaryIntegration))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    # Print summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY - Issue #9: Abbreviation Glossary Dialog")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-
-    if result.wasSuccessful():
-        print("\n✓ ALL TESTS PASSED")
-        return 0
-    else:
-        print("\n✗ SOME TESTS FAILED")
-        return 1
-
-
 if __name__ == '__main__':
-    exit(run_tests())
+    unittest.main(verbosity=2)
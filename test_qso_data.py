@@ -4,14 +4,44 @@ Unit tests for QSO Data Module
 Tests all data structures, validation functions, and sanitization logic
 in the qso_data module.
 
+Run with: python -m pytest test_qso_data.py -v
+
 Author: Generated with Claude Code
 Date: 2025-11-28
 Issue: #2 - QSO Feature: Data Module Foundation
 """
 
+import re
+import sys
+import itertools
 import unittest
 import logging
 import qso_data
+from qso_data import ABBREVIATIONS, COMMON_NAMES, ALL_CITIES, TRANSCEIVERS
+
+
+# Expected formats for generated data values
+_POWER_RE = re.compile(r'\d+W')
+_TEMP_RE = re.compile(r'-?\d+C')
+
+# Every valid RST report: readability 1-5, strength 1-9, tone 1-9
+_VALID_RST = frozenset(f"{r}{s}{t}" for r in "12345" for s in "123456789" for t in "123456789")
+
+# Characters sanitize_text must never let through
+_DANGEROUS_CHARS = frozenset('<>;\x00\n\r\t')
+
+# Input longer than any sanitize_text limit used in the tests
+_LONG_TEXT = 'A' * 200
+
+
+def _lowercase_items(items):
+    """Return the items that contain lowercase characters."""
+    # One scan over the joined buffer covers the common all-uppercase case;
+    # isupper() is also false when there are no cased characters at all,
+    # so fall back to a per-item scan to report the offenders.
+    if '\n'.join(items).isupper():
+        return []
+    return [item for item in items if any(map(str.islower, item))]
 
 
 class TestAbbreviationDictionary(unittest.TestCase):
@@ -19,220 +49,179 @@ class TestAbbreviationDictionary(unittest.TestCase):
 
     def test_abbreviations_exist(self):
         """Test that abbreviation dictionary is loaded."""
-        self.assertIsInstance(qso_data.ABBREVIATIONS, dict)
-        self.assertGreater(len(qso_data.ABBREVIATIONS), 0)
+        self.assertIsInstance(ABBREVIATIONS, dict)
+        self.assertGreater(len(ABBREVIATIONS), 0)
 
     def test_common_abbreviations_present(self):
         """Test that essential abbreviations are present."""
-        essential = ['GM', 'OM', 'TNX', 'FB', 'QTH', '73', 'CQ', 'DE', 'K']
-        for abbr in essential:
-            self.assertIn(abbr, qso_data.ABBREVIATIONS)
-            self.assertIsInstance(qso_data.ABBREVIATIONS[abbr], str)
-            self.assertGreater(len(qso_data.ABBREVIATIONS[abbr]), 0)
+        essential = frozenset({'GM', 'OM', 'TNX', 'FB', 'QTH', '73', 'CQ', 'DE', 'K'})
+        self.assertLessEqual(essential, ABBREVIATIONS.keys())
+
+        empty = [abbr for abbr in essential
+                 if not isinstance(ABBREVIATIONS[abbr], str) or not ABBREVIATIONS[abbr]]
+        self.assertEqual(empty, [], "Essential abbreviations should have meanings")
 
     def test_abbreviation_categories(self):
         """Test that abbreviation categories are properly defined."""
         self.assertIsInstance(qso_data.ABBREVIATION_CATEGORIES, dict)
 
         # Check required categories exist
-        required_categories = ['greetings', 'friendly', 'q_codes', 'prosigns']
+        required_categories = frozenset({'greetings', 'friendly', 'q_codes', 'prosigns'})
+        self.assertLessEqual(required_categories, qso_data.ABBREVIATION_CATEGORIES.keys())
         for category in required_categories:
-            self.assertIn(category, qso_data.ABBREVIATION_CATEGORIES)
             self.assertIsInstance(qso_data.ABBREVIATION_CATEGORIES[category], list)
 
     def test_abbreviations_are_uppercase(self):
         """Test that all abbreviation keys are uppercase."""
-        for abbr in qso_data.ABBREVIATIONS.keys():
-            self.assertEqual(abbr, abbr.upper(), f"Abbreviation '{abbr}' should be uppercase")
+        self.assertEqual(_lowercase_items(ABBREVIATIONS), [],
+                        "Abbreviations should be uppercase")
 
 
 class TestOperatorNames(unittest.TestCase):
     """Test operator names data."""
 
-    def test_names_exist(self):
-        """Test that name list is loaded."""
-        self.assertIsInstance(qso_data.COMMON_NAMES, list)
-        self.assertGreater(len(qso_data.COMMON_NAMES), 0)
+    @classmethod
+    def setUpClass(cls):
+        """Build the set of names once for the class"""
+        cls.names_set = set(COMMON_NAMES)
 
     def test_names_are_uppercase(self):
         """Test that all names are uppercase."""
-        for name in qso_data.COMMON_NAMES:
-            self.assertEqual(name, name.upper(), f"Name '{name}' should be uppercase")
+        self.assertEqual(_lowercase_items(COMMON_NAMES), [],
+                        "Names should be uppercase")
 
     def test_names_are_strings(self):
         """Test that all names are strings."""
-        for name in qso_data.COMMON_NAMES:
-            self.assertIsInstance(name, str)
-            self.assertGreater(len(name), 0)
+        bad = [name for name in COMMON_NAMES if not isinstance(name, str) or not name]
+        self.assertEqual(bad, [])
 
     def test_no_duplicate_names(self):
         """Test that there are no duplicate names."""
-        self.assertEqual(len(qso_data.COMMON_NAMES), len(set(qso_data.COMMON_NAMES)))
+        self.assertEqual(len(COMMON_NAMES), len(self.names_set))
 
 
 class TestGeographicLocations(unittest.TestCase):
     """Test geographic location data (QTH)."""
 
-    def test_city_lists_exist(self):
-        """Test that all city lists are loaded."""
-        city_lists = [
+    @classmethod
+    def setUpClass(cls):
+        """Build the city set and expected ALL_CITIES size once for the class"""
+        cls.cities_set = set(ALL_CITIES)
+
+        # ALL_CITIES should equal US + UK + EU + Asia/Pacific
+        cls.expected_city_count = sum(map(len, (
             qso_data.US_CITIES,
             qso_data.UK_CITIES,
             qso_data.EU_CITIES,
-            qso_data.GERMAN_CITIES,
-            qso_data.FRENCH_CITIES,
-            qso_data.ITALIAN_CITIES,
-            qso_data.BELGIAN_CITIES,
-            qso_data.DUTCH_CITIES,
-            qso_data.SPANISH_CITIES,
             qso_data.ASIA_PACIFIC_CITIES,
-            qso_data.ALL_CITIES,
-        ]
-
-        for city_list in city_lists:
-            self.assertIsInstance(city_list, list)
-            self.assertGreater(len(city_list), 0)
+        )))
 
     def test_cities_are_uppercase(self):
         """Test that all cities are uppercase."""
-        for city in qso_data.ALL_CITIES:
-            self.assertEqual(city, city.upper(), f"City '{city}' should be uppercase")
+        self.assertEqual(_lowercase_items(ALL_CITIES), [],
+                        "Cities should be uppercase")
 
     def test_cities_by_region_structure(self):
         """Test CITIES_BY_REGION dictionary structure."""
         self.assertIsInstance(qso_data.CITIES_BY_REGION, dict)
 
-        expected_regions = ['us', 'uk', 'germany', 'france', 'italy',
-                           'belgium', 'netherlands', 'spain', 'asia_pacific']
+        expected_regions = frozenset({'us', 'uk', 'germany', 'france', 'italy',
+                                      'belgium', 'netherlands', 'spain', 'asia_pacific'})
+        self.assertLessEqual(expected_regions, qso_data.CITIES_BY_REGION.keys())
         for region in expected_regions:
-            self.assertIn(region, qso_data.CITIES_BY_REGION)
             self.assertIsInstance(qso_data.CITIES_BY_REGION[region], list)
 
+        # Every regional city should also be in ALL_CITIES
+        for region, cities in qso_data.CITIES_BY_REGION.items():
+            self.assertLessEqual(set(cities), self.cities_set, f"Region '{region}'")
+
     def test_all_cities_count(self):
         """Test that ALL_CITIES contains expected number of cities."""
-        # ALL_CITIES should equal US + UK + EU + Asia/Pacific
-        expected_count = (len(qso_data.US_CITIES) +
-                         len(qso_data.UK_CITIES) +
-                         len(qso_data.EU_CITIES) +
-                         len(qso_data.ASIA_PACIFIC_CITIES))
-        self.assertEqual(len(qso_data.ALL_CITIES), expected_count)
+        self.assertEqual(len(ALL_CITIES), self.expected_city_count)
+
+    def test_no_duplicate_cities(self):
+        """Test that there are no duplicate cities."""
+        self.assertEqual(len(ALL_CITIES), len(self.cities_set))
 
 
 class TestRadioEquipment(unittest.TestCase):
     """Test radio equipment data."""
 
-    def test_transceiver_lists_exist(self):
-        """Test that transceiver lists are loaded."""
-        transceiver_lists = [
-            qso_data.ICOM_RIGS,
-            qso_data.YAESU_RIGS,
-            qso_data.KENWOOD_RIGS,
-            qso_data.ELECRAFT_RIGS,
-            qso_data.TRANSCEIVERS,
-        ]
-
-        for rig_list in transceiver_lists:
-            self.assertIsInstance(rig_list, list)
-            self.assertGreater(len(rig_list), 0)
-
     def test_transceivers_are_uppercase(self):
         """Test that all transceiver names are uppercase."""
-        for rig in qso_data.TRANSCEIVERS:
-            self.assertEqual(rig, rig.upper(), f"Transceiver '{rig}' should be uppercase")
+        self.assertEqual(_lowercase_items(TRANSCEIVERS), [],
+                        "Transceivers should be uppercase")
 
     def test_antennas_exist(self):
         """Test that antenna list is loaded."""
         self.assertIsInstance(qso_data.ANTENNAS, list)
         self.assertGreater(len(qso_data.ANTENNAS), 10)
 
-    def test_power_levels_exist(self):
-        """Test that power levels list is loaded."""
-        self.assertIsInstance(qso_data.POWER_LEVELS, list)
-        self.assertGreater(len(qso_data.POWER_LEVELS), 0)
-
     def test_power_levels_format(self):
         """Test that power levels are correctly formatted."""
-        for power in qso_data.POWER_LEVELS:
-            self.assertRegex(power, r'^\d+W$', f"Power '{power}' should be in format 'NW'")
+        bad = [power for power in qso_data.POWER_LEVELS if not _POWER_RE.fullmatch(power)]
+        self.assertEqual(bad, [], "Power levels should be in format 'NW'")
 
     def test_equipment_by_type_structure(self):
         """Test EQUIPMENT_BY_TYPE dictionary structure."""
         self.assertIsInstance(qso_data.EQUIPMENT_BY_TYPE, dict)
 
-        expected_types = ['icom', 'yaesu', 'kenwood', 'elecraft']
+        expected_types = frozenset({'icom', 'yaesu', 'kenwood', 'elecraft'})
+        self.assertLessEqual(expected_types, qso_data.EQUIPMENT_BY_TYPE.keys())
         for eq_type in expected_types:
-            self.assertIn(eq_type, qso_data.EQUIPMENT_BY_TYPE)
             self.assertIsInstance(qso_data.EQUIPMENT_BY_TYPE[eq_type], list)
 
 
 class TestEnvironmentalData(unittest.TestCase):
     """Test weather and environmental data."""
 
-    def test_weather_conditions_exist(self):
-        """Test that weather conditions list is loaded."""
-        self.assertIsInstance(qso_data.WEATHER_CONDITIONS, list)
-        self.assertGreater(len(qso_data.WEATHER_CONDITIONS), 0)
-
-    def test_temperatures_exist(self):
-        """Test that temperature list is loaded."""
-        self.assertIsInstance(qso_data.TEMPERATURES, list)
-        self.assertGreater(len(qso_data.TEMPERATURES), 0)
-
     def test_temperature_format(self):
         """Test that temperatures are correctly formatted."""
-        for temp in qso_data.TEMPERATURES:
-            self.assertRegex(temp, r'^-?\d+C$', f"Temperature '{temp}' should be in format 'NC'")
+        bad = [temp for temp in qso_data.TEMPERATURES if not _TEMP_RE.fullmatch(temp)]
+        self.assertEqual(bad, [], "Temperatures should be in format 'NC'")
 
 
 class TestSignalReports(unittest.TestCase):
     """Test signal report (RST) data."""
 
-    def test_rst_reports_exist(self):
-        """Test that RST reports list is loaded."""
-        self.assertIsInstance(qso_data.RST_REPORTS, list)
-        self.assertGreater(len(qso_data.RST_REPORTS), 0)
-
     def test_rst_format(self):
         """Test that RST reports are correctly formatted."""
-        for rst in qso_data.RST_REPORTS:
-            self.assertRegex(rst, r'^[1-5][1-9][1-9]$',
-                           f"RST '{rst}' should be 3 digits (R:1-5, S:1-9, T:1-9)")
+        self.assertLessEqual(set(qso_data.RST_REPORTS), _VALID_RST,
+                             "RST reports should be 3 digits (R:1-5, S:1-9, T:1-9)")
 
     def test_common_rst_values_present(self):
         """Test that common RST values are present."""
-        common_rst = ['599', '589', '579']
-        for rst in common_rst:
-            self.assertIn(rst, qso_data.RST_REPORTS)
+        common_rst = frozenset({'599', '589', '579'})
+        self.assertLessEqual(common_rst, set(qso_data.RST_REPORTS))
 
 
 class TestValidateNameFunction(unittest.TestCase):
     """Test the validate_name() function."""
 
-    def test_valid_names(self):
-        """Test validation of valid names."""
-        valid_names = ['BOB', 'JOHN', 'MARY', 'ANNA', 'HANS']
-        for name in valid_names:
-            self.assertTrue(qso_data.validate_name(name),
-                          f"'{name}' should be valid")
-
-    def test_invalid_names(self):
-        """Test rejection of invalid names."""
-        invalid_names = [
-            '',                      # Empty
-            'bob',                   # Lowercase
-            '123',                   # Numbers only
-            'BOB123',                # Contains numbers
-            'A',                     # Too short (less than 2 chars)
-            'A' * 50,                # Too long
-            'BOB<SCRIPT>',           # Injection attempt
-            'BOB; DROP TABLE',       # SQL injection attempt
-            None,                    # None type
-            123,                     # Wrong type
-        ]
-
-        for name in invalid_names:
-            self.assertFalse(qso_data.validate_name(name),
-                           f"'{name}' should be invalid")
+    # (value, expected validity)
+    CASES = (
+        ('BOB', True),
+        ('JOHN', True),
+        ('MARY', True),
+        ('ANNA', True),
+        ('HANS', True),
+        ('', False),                     # Empty
+        ('bob', False),                  # Lowercase
+        ('123', False),                  # Numbers only
+        ('BOB123', False),               # Contains numbers
+        ('A', False),                    # Too short (less than 2 chars)
+        ('A' * 50, False),               # Too long
+        ('BOB<SCRIPT>', False),          # Injection attempt
+        ('BOB; DROP TABLE', False),      # SQL injection attempt
+        (None, False),                   # None type
+        (123, False),                    # Wrong type
+    )
+
+    def test_validate(self):
+        """Test validation of valid and invalid names."""
+        bad = [(name, expected) for name, expected in self.CASES
+               if qso_data.validate_name(name) != expected]
+        self.assertEqual(bad, [])
 
     def test_name_with_spaces(self):
         """Test names with spaces."""
@@ -246,118 +235,121 @@ class TestValidateNameFunction(unittest.TestCase):
 class TestValidateQTHFunction(unittest.TestCase):
     """Test the validate_qth() function."""
 
-    def test_valid_qth(self):
-        """Test validation of valid locations."""
-        valid_qth = ['BOSTON', 'LONDON', 'BERLIN', 'NEW YORK', 'LOS ANGELES']
-        for qth in valid_qth:
-            self.assertTrue(qso_data.validate_qth(qth),
-                          f"'{qth}' should be valid")
-
-    def test_invalid_qth(self):
-        """Test rejection of invalid locations."""
-        invalid_qth = [
-            '',                      # Empty
-            'boston',                # Lowercase
-            '---',                   # Invalid characters
-            'A',                     # Too short
-            'X' * 100,               # Too long
-            'BOSTON123',             # Contains numbers
-            None,                    # None type
-            123,                     # Wrong type
-        ]
-
-        for qth in invalid_qth:
-            self.assertFalse(qso_data.validate_qth(qth),
-                           f"'{qth}' should be invalid")
+    # (value, expected validity)
+    CASES = (
+        ('BOSTON', True),
+        ('LONDON', True),
+        ('BERLIN', True),
+        ('NEW YORK', True),
+        ('LOS ANGELES', True),
+        ('', False),                     # Empty
+        ('boston', False),               # Lowercase
+        ('---', False),                  # Invalid characters
+        ('A', False),                    # Too short
+        ('X' * 100, False),              # Too long
+        ('BOSTON123', False),            # Contains numbers
+        (None, False),                   # None type
+        (123, False),                    # Wrong type
+    )
+
+    def test_validate(self):
+        """Test validation of valid and invalid locations."""
+        bad = [(qth, expected) for qth, expected in self.CASES
+               if qso_data.validate_qth(qth) != expected]
+        self.assertEqual(bad, [])
 
 
 class TestValidateRSTFunction(unittest.TestCase):
     """Test the validate_rst() function."""
 
-    def test_valid_rst(self):
-        """Test validation of valid RST reports."""
-        valid_rst = ['599', '589', '579', '569', '559', '549', '539', '449', '119']
-        for rst in valid_rst:
-            self.assertTrue(qso_data.validate_rst(rst),
-                          f"'{rst}' should be valid")
-
-    def test_invalid_rst(self):
-        """Test rejection of invalid RST reports."""
-        invalid_rst = [
-            '',                      # Empty
-            '99',                    # Too short
-            '5999',                  # Too long
-            '000',                   # Invalid values (0s)
-            '999',                   # Invalid readability (9)
-            '699',                   # Invalid readability (6)
-            '590',                   # Invalid strength (0)
-            '500',                   # Invalid tone (0)
-            'ABC',                   # Letters
-            '59',                    # Missing digit
-            None,                    # None type
-            599,                     # Wrong type (int instead of string)
-        ]
-
-        for rst in invalid_rst:
-            self.assertFalse(qso_data.validate_rst(rst),
-                           f"'{rst}' should be invalid")
+    # (value, expected validity)
+    CASES = (
+        ('599', True),
+        ('589', True),
+        ('579', True),
+        ('569', True),
+        ('559', True),
+        ('549', True),
+        ('539', True),
+        ('449', True),
+        ('119', True),
+        ('', False),                     # Empty
+        ('99', False),                   # Too short
+        ('5999', False),                 # Too long
+        ('000', False),                  # Invalid values (0s)
+        ('999', False),                  # Invalid readability (9)
+        ('699', False),                  # Invalid readability (6)
+        ('590', False),                  # Invalid strength (0)
+        ('500', False),                  # Invalid tone (0)
+        ('ABC', False),                  # Letters
+        ('59', False),                   # Missing digit
+        (None, False),                   # None type
+        (599, False),                    # Wrong type (int instead of string)
+    )
+
+    def test_validate(self):
+        """Test validation of valid and invalid RST reports."""
+        bad = [(rst, expected) for rst, expected in self.CASES
+               if qso_data.validate_rst(rst) != expected]
+        self.assertEqual(bad, [])
 
 
 class TestValidateEquipmentFunction(unittest.TestCase):
     """Test the validate_equipment() function."""
 
-    def test_valid_equipment(self):
-        """Test validation of valid equipment names."""
-        valid_equipment = ['IC7300', 'FT991A', 'DIPOLE', 'YAGI', 'BEAM', 'K3']
-        for equipment in valid_equipment:
-            self.assertTrue(qso_data.validate_equipment(equipment),
-                          f"'{equipment}' should be valid")
-
-    def test_invalid_equipment(self):
-        """Test rejection of invalid equipment."""
-        invalid_equipment = [
-            '',                      # Empty
-            'ic7300',                # Lowercase
-            'X',                     # Too short
-            'A' * 100,               # Too long
-            'RIG<SCRIPT>',           # Injection attempt
-            None,                    # None type
-            123,                     # Wrong type
-        ]
-
-        for equipment in invalid_equipment:
-            self.assertFalse(qso_data.validate_equipment(equipment),
-                           f"'{equipment}' should be invalid")
+    # (value, expected validity)
+    CASES = (
+        ('IC7300', True),
+        ('FT991A', True),
+        ('DIPOLE', True),
+        ('YAGI', True),
+        ('BEAM', True),
+        ('K3', True),
+        ('', False),                     # Empty
+        ('ic7300', False),               # Lowercase
+        ('X', False),                    # Too short
+        ('A' * 100, False),              # Too long
+        ('RIG<SCRIPT>', False),          # Injection attempt
+        (None, False),                   # None type
+        (123, False),                    # Wrong type
+    )
+
+    def test_validate(self):
+        """Test validation of valid and invalid equipment names."""
+        bad = [(equipment, expected) for equipment, expected in self.CASES
+               if qso_data.validate_equipment(equipment) != expected]
+        self.assertEqual(bad, [])
 
 
 class TestValidatePowerFunction(unittest.TestCase):
     """Test the validate_power() function."""
 
-    def test_valid_power(self):
-        """Test validation of valid power levels."""
-        valid_power = ['5W', '10W', '50W', '100W', '500W', '1000W', '1500W']
-        for power in valid_power:
-            self.assertTrue(qso_data.validate_power(power),
-                          f"'{power}' should be valid")
-
-    def test_invalid_power(self):
-        """Test rejection of invalid power levels."""
-        invalid_power = [
-            '',                      # Empty
-            '100',                   # Missing 'W'
-            'W100',                  # Wrong format
-            '100w',                  # Lowercase
-            '0W',                    # Too low
-            '2000W',                 # Too high (above amateur radio limits)
-            'ABCW',                  # Letters
-            '100 W',                 # Space
-            None,                    # None type
-            100,                     # Wrong type
-        ]
-
-        for power in invalid_power:
-            self.assertFalse(qso_data.validate_power(power),
-                           f"'{power}' should be invalid")
+    # (value, expected validity)
+    CASES = (
+        ('5W', True),
+        ('10W', True),
+        ('50W', True),
+        ('100W', True),
+        ('500W', True),
+        ('1000W', True),
+        ('1500W', True),
+        ('', False),                     # Empty
+        ('100', False),                  # Missing 'W'
+        ('W100', False),                 # Wrong format
+        ('100w', False),                 # Lowercase
+        ('0W', False),                   # Too low
+        ('2000W', False),                # Too high (above amateur radio limits)
+        ('ABCW', False),                 # Letters
+        ('100 W', False),                # Space
+        (None, False),                   # None type
+        (100, False),                    # Wrong type
+    )
+
+    def test_validate(self):
+        """Test validation of valid and invalid power levels."""
+        bad = [(power, expected) for power, expected in self.CASES
+               if qso_data.validate_power(power) != expected]
+        self.assertEqual(bad, [])
 
 
 class TestSanitizeTextFunction(unittest.TestCase):
@@ -389,13 +381,12 @@ class TestSanitizeTextFunction(unittest.TestCase):
         for dangerous_input in dangerous_inputs:
             result = qso_data.sanitize_text(dangerous_input)
             # Should not contain any dangerous characters
-            self.assertNotRegex(result, r'[<>;\x00\n\r\t]',
-                              f"Sanitized text should not contain dangerous characters")
+            self.assertTrue(_DANGEROUS_CHARS.isdisjoint(result),
+                            f"Sanitized text should not contain dangerous characters: {result!r}")
 
     def test_sanitization_length_limit(self):
         """Test that sanitization enforces length limits."""
-        long_text = 'A' * 200
-        result = qso_data.sanitize_text(long_text, max_length=50)
+        result = qso_data.sanitize_text(_LONG_TEXT, max_length=50)
         self.assertEqual(len(result), 50, "Sanitized text should be truncated to max_length")
 
     def test_sanitization_empty_input(self):
@@ -441,54 +432,72 @@ class TestModuleStructure(unittest.TestCase):
 class TestDataIntegrity(unittest.TestCase):
     """Test overall data integrity and consistency."""
 
-    def test_no_empty_lists(self):
-        """Test that no data lists are empty."""
-        data_lists = [
-            ('ABBREVIATIONS', qso_data.ABBREVIATIONS),
-            ('COMMON_NAMES', qso_data.COMMON_NAMES),
-            ('US_CITIES', qso_data.US_CITIES),
-            ('TRANSCEIVERS', qso_data.TRANSCEIVERS),
-            ('ANTENNAS', qso_data.ANTENNAS),
-            ('POWER_LEVELS', qso_data.POWER_LEVELS),
-            ('WEATHER_CONDITIONS', qso_data.WEATHER_CONDITIONS),
-            ('TEMPERATURES', qso_data.TEMPERATURES),
-            ('RST_REPORTS', qso_data.RST_REPORTS),
-        ]
-
-        for name, data_list in data_lists:
-            self.assertGreater(len(data_list), 0, f"{name} should not be empty")
+    # Every data list in qso_data; each must be a non-empty list
+    DATA_LISTS = (
+        'COMMON_NAMES',
+        'US_CITIES',
+        'UK_CITIES',
+        'EU_CITIES',
+        'GERMAN_CITIES',
+        'FRENCH_CITIES',
+        'ITALIAN_CITIES',
+        'BELGIAN_CITIES',
+        'DUTCH_CITIES',
+        'SPANISH_CITIES',
+        'ASIA_PACIFIC_CITIES',
+        'ALL_CITIES',
+        'ICOM_RIGS',
+        'YAESU_RIGS',
+        'KENWOOD_RIGS',
+        'ELECRAFT_RIGS',
+        'TRANSCEIVERS',
+        'ANTENNAS',
+        'POWER_LEVELS',
+        'WEATHER_CONDITIONS',
+        'TEMPERATURES',
+        'RST_REPORTS',
+    )
+
+    def test_data_lists_populated(self):
+        """Test that every data list is a non-empty list."""
+        for name in self.DATA_LISTS:
+            data_list = getattr(qso_data, name)
+            with self.subTest(name=name):
+                self.assertIsInstance(data_list, list)
+                self.assertGreater(len(data_list), 0, f"{name} should not be empty")
 
     def test_data_types_consistency(self):
         """Test that data types are consistent within lists."""
-        # All items in name list should be strings
-        for name in qso_data.COMMON_NAMES:
-            self.assertIsInstance(name, str)
+        # All items in name, city and equipment lists should be strings
+        non_strings = [
+            item for item in itertools.chain(COMMON_NAMES, ALL_CITIES, TRANSCEIVERS)
+            if not isinstance(item, str)
+        ]
+        self.assertEqual(non_strings, [])
 
-        # All items in city lists should be strings
-        for city in qso_data.ALL_CITIES:
-            self.assertIsInstance(city, str)
 
-        # All items in equipment lists should be strings
-        for rig in qso_data.TRANSCEIVERS:
-            self.assertIsInstance(rig, str)
+def setUpModule():
+    """Suppress logging while this module's tests run"""
+    # The validators log every rejected input; disabling logging up front
+    # lets those calls return immediately, under pytest as well as run_tests()
+    logging.disable(logging.CRITICAL)
+
+
+def tearDownModule():
+    """Re-enable logging for other test modules"""
+    logging.disable(logging.NOTSET)
 
 
 def run_tests():
     """Run all tests and return results."""
-    # Suppress logging during tests
-    logging.disable(logging.CRITICAL)
-
     # Create test suite
     loader = unittest.TestLoader()
-    suite = loader.loadTestsFromModule(__import__(__name__))
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
 
-    # Re-enable logging
-    logging.disable(logging.NOTSET)
-
     return result
 
 
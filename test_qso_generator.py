@@ -3,30 +3,61 @@ Unit tests for QSOGenerator class
 
 Tests complete QSO generation integration.
 
+Run with: python -m pytest test_qso_generator.py -v
+
 Author: Generated with Claude Code
 Date: 2025-11-28
 Issue: #5 - QSO Feature: QSO Generator Integration
 """
 
 import unittest
-from qso_data import QSOGenerator, CallSignGenerator
 import qso_data
 
 
+# Hashed views of the data lists for O(1) membership checks
+_NAMES = frozenset(qso_data.COMMON_NAMES)
+_CITIES = frozenset(qso_data.ALL_CITIES)
+_TRANSCEIVERS = frozenset(qso_data.TRANSCEIVERS)
+_ANTENNAS = frozenset(qso_data.ANTENNAS)
+_POWER_LEVELS = frozenset(qso_data.POWER_LEVELS)
+_WEATHER_CONDITIONS = frozenset(qso_data.WEATHER_CONDITIONS)
+_TEMPERATURES = frozenset(qso_data.TEMPERATURES)
+_RST_REPORTS = frozenset(qso_data.RST_REPORTS)
+
+# Shared call sign validator
+_CALL_GEN = qso_data.CallSignGenerator()
+
+# First letters of US and UK call signs
+_US_PREFIXES = frozenset('WKNA')
+_UK_PREFIXES = frozenset('GM')
+
+# Fields every generated station carries
+_STATION_FIELDS = frozenset((
+    'callsign', 'name', 'qth', 'rst', 'rig',
+    'antenna', 'power', 'weather', 'temperature'
+))
+
+# Station fields copied into a QSO's scoring elements
+_ELEMENT_FIELDS = frozenset(('callsign', 'name', 'qth', 'rst', 'rig', 'antenna', 'power'))
+
+# Element lists returned by extract_qso_elements
+_EXTRACTED_ELEMENTS = frozenset(('callsigns', 'names', 'qths', 'rsts', 'rigs', 'antennas', 'powers'))
+
+
 class TestQSOGeneratorInit(unittest.TestCase):
     """Test QSOGenerator initialization."""
 
     def test_initialization(self):
         """Test that generator initializes correctly."""
-        gen = QSOGenerator()
-        self.assertIsInstance(gen, QSOGenerator)
+        gen = qso_data.QSOGenerator()
+        self.assertIsInstance(gen, qso_data.QSOGenerator)
         self.assertTrue(hasattr(gen, 'call_gen'))
         self.assertTrue(hasattr(gen, 'template_gen'))
         self.assertTrue(hasattr(gen, 'random'))
 
     def test_initialization_with_seed(self):
         """Test initialization with random seed stores seed."""
-        gen = QSOGenerator(seed=42)
+        gen = qso_data.QSOGenerator(seed=42)
 
         # Should store seed
         self.assertEqual(gen.seed, 42)
@@ -40,92 +71,90 @@ class TestQSOGeneratorInit(unittest.TestCase):
 class TestRandomSelectionMethods(unittest.TestCase):
     """Test random data selection methods."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test generator shared by the class."""
+        cls.gen = qso_data.QSOGenerator()
 
     def test_select_random_name(self):
         """Test random name selection."""
         name = self.gen._select_random_name()
         self.assertIsInstance(name, str)
-        self.assertIn(name, qso_data.COMMON_NAMES)
+        self.assertIn(name, _NAMES)
 
     def test_select_random_city(self):
         """Test random city selection."""
         city = self.gen._select_random_city()
         self.assertIsInstance(city, str)
-        self.assertIn(city, qso_data.ALL_CITIES)
+        self.assertIn(city, _CITIES)
 
     def test_select_random_transceiver(self):
         """Test random transceiver selection."""
         rig = self.gen._select_random_transceiver()
         self.assertIsInstance(rig, str)
-        self.assertIn(rig, qso_data.TRANSCEIVERS)
+        self.assertIn(rig, _TRANSCEIVERS)
 
     def test_select_random_antenna(self):
         """Test random antenna selection."""
         ant = self.gen._select_random_antenna()
         self.assertIsInstance(ant, str)
-        self.assertIn(ant, qso_data.ANTENNAS)
+        self.assertIn(ant, _ANTENNAS)
 
     def test_select_random_power(self):
         """Test random power selection."""
         pwr = self.gen._select_random_power()
         self.assertIsInstance(pwr, str)
-        self.assertIn(pwr, qso_data.POWER_LEVELS)
+        self.assertIn(pwr, _POWER_LEVELS)
 
     def test_select_random_weather(self):
         """Test random weather selection."""
         wx = self.gen._select_random_weather()
         self.assertIsInstance(wx, str)
-        self.assertIn(wx, qso_data.WEATHER_CONDITIONS)
+        self.assertIn(wx, _WEATHER_CONDITIONS)
 
     def test_select_random_temperature(self):
         """Test random temperature selection."""
         temp = self.gen._select_random_temperature()
         self.assertIsInstance(temp, str)
-        self.assertIn(temp, qso_data.TEMPERATURES)
+        self.assertIn(temp, _TEMPERATURES)
 
     def test_select_random_rst(self):
         """Test random RST selection."""
         rst = self.gen._select_random_rst()
         self.assertIsInstance(rst, str)
-        self.assertIn(rst, qso_data.RST_REPORTS)
+        self.assertIn(rst, _RST_REPORTS)
 
     def test_selection_variety(self):
         """Test that selections show variety."""
-        names = [self.gen._select_random_name() for _ in range(20)]
-        unique_names = set(names)
+        # A fixed seed makes the diversity deterministic, so a few draws suffice
+        gen = qso_data.QSOGenerator(seed=1234)
+        select_name = gen._select_random_name
+        unique_names = {select_name() for _ in range(6)}
         self.assertGreater(len(unique_names), 3, "Should have variety in names")
 
 
 class TestStationDataGeneration(unittest.TestCase):
     """Test station data generation."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test generator shared by the class."""
+        cls.gen = qso_data.QSOGenerator()
 
     def test_generate_station_data_structure(self):
         """Test that station data has correct structure."""
         station = self.gen.generate_station_data()
 
         # Check all required fields present
-        required_fields = [
-            'callsign', 'name', 'qth', 'rst', 'rig',
-            'antenna', 'power', 'weather', 'temperature'
-        ]
-        for field in required_fields:
-            self.assertIn(field, station)
-            self.assertIsInstance(station[field], str)
+        self.assertLessEqual(_STATION_FIELDS, station.keys())
+        self.assertTrue(all(isinstance(station[field], str) for field in _STATION_FIELDS))
 
     def test_generate_station_data_valid(self):
         """Test that generated station data is valid."""
         station = self.gen.generate_station_data()
 
         # Validate call sign
-        call_gen = CallSignGenerator()
-        self.assertTrue(call_gen.validate_callsign(station['callsign']))
+        self.assertTrue(_CALL_GEN.validate_callsign(station['callsign']))
 
         # Validate name
         self.assertTrue(qso_data.validate_name(station['name']))
@@ -149,56 +178,55 @@ class TestStationDataGeneration(unittest.TestCase):
         station_uk = self.gen.generate_station_data(call_region='uk')
 
         # US call signs start with W, K, N, A
-        self.assertTrue(station_us['callsign'][0] in 'WKNA')
+        self.assertTrue(station_us['callsign'][0] in _US_PREFIXES)
 
         # UK call signs start with G or M
-        self.assertTrue(station_uk['callsign'][0] in 'GM')
+        self.assertTrue(station_uk['callsign'][0] in _UK_PREFIXES)
 
     def test_multiple_stations_unique(self):
         """Test that multiple stations are unique."""
-        stations = [self.gen.generate_station_data() for _ in range(10)]
+        gen = qso_data.QSOGenerator(seed=1234)
+        generate_station = gen.generate_station_data
+        stations = [generate_station() for _ in range(7)]
 
         # Should have variety in callsigns
-        callsigns = [s['callsign'] for s in stations]
-        unique_callsigns = set(callsigns)
-        self.assertGreater(len(unique_callsigns), 5)
+        self.assertGreater(len({s['callsign'] for s in stations}), 5)
 
 
 class TestQSOGeneration(unittest.TestCase):
     """Test complete QSO generation."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test generator and a read-only QSO per verbosity."""
+        cls.gen = qso_data.QSOGenerator()
+        cls.qso_default = cls.gen.generate_qso()
+        cls.qso_minimal = cls.gen.generate_qso(verbosity='minimal')
+        cls.qso_medium = cls.gen.generate_qso(verbosity='medium')
+        cls.qso_chatty = cls.gen.generate_qso(verbosity='chatty')
 
     def test_generate_qso_structure(self):
         """Test that generated QSO has correct structure."""
-        qso = self.gen.generate_qso()
+        qso = self.qso_default
 
         # Check all required top-level fields
-        required_fields = [
+        required_fields = frozenset((
             'calling_station', 'responding_station',
             'full_text', 'verbosity', 'template', 'elements'
-        ]
-        for field in required_fields:
-            self.assertIn(field, qso)
+        ))
+        self.assertLessEqual(required_fields, qso.keys())
 
     def test_generate_qso_stations(self):
         """Test that QSO contains valid station data."""
-        qso = self.gen.generate_qso()
+        qso = self.qso_default
 
         # Both stations should have all fields
         for station in [qso['calling_station'], qso['responding_station']]:
-            required_fields = [
-                'callsign', 'name', 'qth', 'rst', 'rig',
-                'antenna', 'power', 'weather', 'temperature'
-            ]
-            for field in required_fields:
-                self.assertIn(field, station)
+            self.assertLessEqual(_STATION_FIELDS, station.keys())
 
     def test_generate_qso_full_text(self):
         """Test that QSO full_text is generated."""
-        qso = self.gen.generate_qso()
+        qso = self.qso_default
 
         self.assertIsInstance(qso['full_text'], str)
         self.assertGreater(len(qso['full_text']), 100)
@@ -206,24 +234,22 @@ class TestQSOGeneration(unittest.TestCase):
         # Should start with CQ
         self.assertTrue(qso['full_text'].strip().startswith('CQ'))
 
-        # Should contain call signs
-        self.assertIn(qso['calling_station']['callsign'], qso['full_text'])
-        self.assertIn(qso['responding_station']['callsign'], qso['full_text'])
-
-        # Should contain names
-        self.assertIn(qso['calling_station']['name'], qso['full_text'])
-        self.assertIn(qso['responding_station']['name'], qso['full_text'])
+        # Should contain call signs and names
+        for station in ('calling_station', 'responding_station'):
+            for field in ('callsign', 'name'):
+                with self.subTest(station=station, field=field):
+                    self.assertIn(qso[station][field], qso['full_text'])
 
     def test_generate_qso_verbosity_minimal(self):
         """Test minimal verbosity QSO generation."""
-        qso = self.gen.generate_qso(verbosity='minimal')
+        qso = self.qso_minimal
 
         self.assertEqual(qso['verbosity'], 'minimal')
         self.assertIsInstance(qso['full_text'], str)
 
     def test_generate_qso_verbosity_medium(self):
         """Test medium verbosity QSO generation."""
-        qso = self.gen.generate_qso(verbosity='medium')
+        qso = self.qso_medium
 
         self.assertEqual(qso['verbosity'], 'medium')
         # Medium should contain equipment
@@ -231,7 +257,7 @@ class TestQSOGeneration(unittest.TestCase):
 
     def test_generate_qso_verbosity_chatty(self):
         """Test chatty verbosity QSO generation."""
-        qso = self.gen.generate_qso(verbosity='chatty')
+        qso = self.qso_chatty
 
         self.assertEqual(qso['verbosity'], 'chatty')
         # Chatty should contain weather
@@ -242,22 +268,19 @@ class TestQSOGeneration(unittest.TestCase):
         qso = self.gen.generate_qso(call_region1='us', call_region2='uk')
 
         # Verify regions
-        self.assertTrue(qso['calling_station']['callsign'][0] in 'WKNA')
-        self.assertTrue(qso['responding_station']['callsign'][0] in 'GM')
+        self.assertTrue(qso['calling_station']['callsign'][0] in _US_PREFIXES)
+        self.assertTrue(qso['responding_station']['callsign'][0] in _UK_PREFIXES)
 
     def test_generate_qso_elements(self):
         """Test that QSO elements are correctly structured."""
-        qso = self.gen.generate_qso()
+        qso = self.qso_default
 
         # Elements should have station1 and station2
-        self.assertIn('station1', qso['elements'])
-        self.assertIn('station2', qso['elements'])
+        self.assertLessEqual({'station1', 'station2'}, qso['elements'].keys())
 
         # Each station should have key fields
         for station_key in ['station1', 'station2']:
-            station = qso['elements'][station_key]
-            for field in ['callsign', 'name', 'qth', 'rst', 'rig', 'antenna', 'power']:
-                self.assertIn(field, station)
+            self.assertLessEqual(_ELEMENT_FIELDS, qso['elements'][station_key].keys())
 
     def test_generate_qso_invalid_verbosity(self):
         """Test that invalid verbosity raises error."""
@@ -265,61 +288,52 @@ class TestQSOGeneration(unittest.TestCase):
             self.gen.generate_qso(verbosity='invalid')
 
 
-class TestQSOExtraction(unittest.TestCase):
-    """Test QSO element extraction."""
+class TestQSOConsumers(unittest.TestCase):
+    """Test element extraction, Morse text and integration on one shared QSO."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Generate one QSO and everything derived from it for the class."""
+        cls.gen = qso_data.QSOGenerator(seed=7)
+        cls.qso = cls.gen.generate_qso()
+        cls.elements = cls.gen.extract_qso_elements(cls.qso)
+        cls.morse_text = cls.gen.get_morse_text(cls.qso)
 
     def test_extract_qso_elements(self):
         """Test extraction of QSO elements."""
-        qso = self.gen.generate_qso()
-        elements = self.gen.extract_qso_elements(qso)
+        elements = self.elements
 
-        # Check all required element types
-        required = ['callsigns', 'names', 'qths', 'rsts', 'rigs', 'antennas', 'powers']
-        for elem_type in required:
-            self.assertIn(elem_type, elements)
-            self.assertIsInstance(elements[elem_type], list)
-            self.assertEqual(len(elements[elem_type]), 2)
+        # Check all required element types: each a list of two values
+        self.assertLessEqual(_EXTRACTED_ELEMENTS, elements.keys())
+        self.assertTrue(all(
+            isinstance(elements[elem_type], list) and len(elements[elem_type]) == 2
+            for elem_type in _EXTRACTED_ELEMENTS
+        ))
 
     def test_extract_callsigns(self):
         """Test extraction of callsigns."""
-        qso = self.gen.generate_qso()
-        elements = self.gen.extract_qso_elements(qso)
+        qso, elements = self.qso, self.elements
 
         self.assertEqual(elements['callsigns'][0], qso['calling_station']['callsign'])
         self.assertEqual(elements['callsigns'][1], qso['responding_station']['callsign'])
 
     def test_extract_names(self):
         """Test extraction of names."""
-        qso = self.gen.generate_qso()
-        elements = self.gen.extract_qso_elements(qso)
+        qso, elements = self.qso, self.elements
 
         self.assertEqual(elements['names'][0], qso['calling_station']['name'])
         self.assertEqual(elements['names'][1], qso['responding_station']['name'])
 
-
-class TestMorseTextExtraction(unittest.TestCase):
-    """Test Morse text extraction."""
-
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
-
     def test_get_morse_text(self):
         """Test extraction of Morse-ready text."""
-        qso = self.gen.generate_qso()
-        morse_text = self.gen.get_morse_text(qso)
+        morse_text = self.morse_text
 
         self.assertIsInstance(morse_text, str)
-        self.assertEqual(morse_text, qso['full_text'])
+        self.assertEqual(morse_text, self.qso['full_text'])
 
     def test_morse_text_format(self):
         """Test that Morse text is properly formatted."""
-        qso = self.gen.generate_qso()
-        morse_text = self.gen.get_morse_text(qso)
+        morse_text = self.morse_text
 
         # Should be uppercase
         self.assertEqual(morse_text, morse_text.upper())
@@ -330,13 +344,46 @@ class TestMorseTextExtraction(unittest.TestCase):
         self.assertIn('K', morse_text)
         self.assertIn('SK', morse_text)
 
+    def test_integration_with_callsign_generator(self):
+        """Test integration with CallSignGenerator."""
+        qso = self.qso
+
+        # Call signs should be valid
+        self.assertTrue(_CALL_GEN.validate_callsign(qso['calling_station']['callsign']))
+        self.assertTrue(_CALL_GEN.validate_callsign(qso['responding_station']['callsign']))
+
+    def test_integration_with_template_system(self):
+        """Test integration with QSOTemplate."""
+        qso = self.qso
+
+        # Should have template field
+        self.assertIn('template', qso)
+        self.assertIsInstance(qso['template'], str)
+
+        # Template should contain placeholders before substitution
+        self.assertIn('{CALL', qso['template'])
+
+    def test_integration_with_validation(self):
+        """Test that all generated data passes validation."""
+        qso = self.qso
+
+        # Validate all station data
+        for station in [qso['calling_station'], qso['responding_station']]:
+            self.assertTrue(qso_data.validate_name(station['name']))
+            self.assertTrue(qso_data.validate_qth(station['qth']))
+            self.assertTrue(qso_data.validate_rst(station['rst']))
+            self.assertTrue(qso_data.validate_equipment(station['rig']))
+            self.assertTrue(qso_data.validate_equipment(station['antenna']))
+            self.assertTrue(qso_data.validate_power(station['power']))
+
 
 class TestMultipleQSOGeneration(unittest.TestCase):
     """Test generation of multiple QSOs."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test generator shared by the class."""
+        cls.gen = qso_data.QSOGenerator()
 
     def test_generate_multiple_qsos(self):
         """Test generation of multiple QSOs."""
@@ -360,69 +407,29 @@ class TestMultipleQSOGeneration(unittest.TestCase):
 
     def test_multiple_qsos_unique(self):
         """Test that multiple QSOs are unique."""
-        qsos = self.gen.generate_multiple_qsos(count=10)
+        gen = qso_data.QSOGenerator(seed=1234)
+        qsos = gen.generate_multiple_qsos(count=7)
 
         # Should have variety in callsigns
-        callsigns = [qso['calling_station']['callsign'] for qso in qsos]
-        unique_callsigns = set(callsigns)
-        self.assertGreater(len(unique_callsigns), 5)
+        self.assertGreater(len({qso['calling_station']['callsign'] for qso in qsos}), 5)
 
         # Should have variety in full text
-        texts = [qso['full_text'] for qso in qsos]
-        unique_texts = set(texts)
-        self.assertGreater(len(unique_texts), 5)
+        self.assertGreater(len({qso['full_text'] for qso in qsos}), 5)
 
     def test_generate_multiple_invalid_count(self):
         """Test that invalid count raises error."""
-        with self.assertRaises(ValueError):
-            self.gen.generate_multiple_qsos(count=0)
-
-        with self.assertRaises(ValueError):
-            self.gen.generate_multiple_qsos(count=101)
-
-        with self.assertRaises(ValueError):
-            self.gen.generate_multiple_qsos(count='invalid')
+        for count in (0, 101, 'invalid'):
+            with self.subTest(count=count), self.assertRaises(ValueError):
+                self.gen.generate_multiple_qsos(count=count)
 
 
 class TestIntegration(unittest.TestCase):
     """Test integration with other components."""
 
-    def setUp(self):
-        """Set up test generator."""
-        self.gen = QSOGenerator()
-
-    def test_integration_with_callsign_generator(self):
-        """Test integration with CallSignGenerator."""
-        qso = self.gen.generate_qso()
-
-        # Call signs should be valid
-        call_gen = CallSignGenerator()
-        self.assertTrue(call_gen.validate_callsign(qso['calling_station']['callsign']))
-        self.assertTrue(call_gen.validate_callsign(qso['responding_station']['callsign']))
-
-    def test_integration_with_template_system(self):
-        """Test integration with QSOTemplate."""
-        qso = self.gen.generate_qso()
-
-        # Should have template field
-        self.assertIn('template', qso)
-        self.assertIsInstance(qso['template'], str)
-
-        # Template should contain placeholders before substitution
-        self.assertIn('{CALL', qso['template'])
-
-    def test_integration_with_validation(self):
-        """Test that all generated data passes validation."""
-        qso = self.gen.generate_qso()
-
-        # Validate all station data
-        for station in [qso['calling_station'], qso['responding_station']]:
-            self.assertTrue(qso_data.validate_name(station['name']))
-            self.assertTrue(qso_data.validate_qth(station['qth']))
-            self.assertTrue(qso_data.validate_rst(station['rst']))
-            self.assertTrue(qso_data.validate_equipment(station['rig']))
-            self.assertTrue(qso_data.validate_equipment(station['antenna']))
-            self.assertTrue(qso_data.validate_power(station['power']))
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test generator shared by the class."""
+        cls.gen = qso_data.QSOGenerator()
 
     def test_end_to_end_workflow(self):
         """Test complete end-to-end QSO generation workflow."""
@@ -450,22 +457,34 @@ class TestReproducibility(unittest.TestCase):
 
     def test_seed_stored(self):
         """Test that seed is stored for potential future use."""
-        gen = QSOGenerator(seed=123)
+        gen = qso_data.QSOGenerator(seed=123)
         self.assertEqual(gen.seed, 123)
 
-        gen_no_seed = QSOGenerator()
+        gen_no_seed = qso_data.QSOGenerator()
         self.assertIsNone(gen_no_seed.seed)
 
+    def test_seed_reproduces_output(self):
+        """Test that the same seed reproduces the same QSOs."""
+        first = [q['full_text'] for q in qso_data.QSOGenerator(seed=7).generate_multiple_qsos(count=3)]
+        second = [q['full_text'] for q in qso_data.QSOGenerator(seed=7).generate_multiple_qsos(count=3)]
+        self.assertEqual(first, second)
+
+    def test_seed_does_not_touch_global_random(self):
+        """Test that seeding the generator leaves the global random state alone."""
+        import random
+        state = random.getstate()
+        qso_data.QSOGenerator(seed=7).generate_qso()
+        self.assertEqual(random.getstate(), state)
+
     def test_generator_produces_varied_output(self):
         """Test that generator produces variety without seed."""
-        gen = QSOGenerator()
+        gen = qso_data.QSOGenerator()
 
-        qsos = [gen.generate_qso() for _ in range(10)]
+        generate_qso = gen.generate_qso
+        qsos = [generate_qso() for _ in range(10)]
 
         # Should have variety
-        callsigns = [q['calling_station']['callsign'] for q in qsos]
-        unique_callsigns = set(callsigns)
-        self.assertGreater(len(unique_callsigns), 3)
+        self.assertGreater(len({q['calling_station']['callsign'] for q in qsos}), 3)
 
 
 def run_tests():
@@ -7,24 +7,136 @@ Tests cover the bugs we fixed:
 - State transitions
 - Pause/Resume/Stop/Replay controls
 
+No test sleeps: mocked playback blocks on a threading.Event the test sets,
+so elapsed time never depends on the wall clock.
+
 Run with: python -m unittest test_qso_practice.py -v
 """
 
+import itertools
 import unittest
 from unittest.mock import MagicMock, patch
-import time
+import threading
 from qso_practice import QSOPracticeSession
 from qso_data import QSOGenerator
+import qso_data
 from qso_scoring import QSOScorer, SessionScorer
 
 
-class TestQSOPracticeSession(unittest.TestCase):
+# The MorseCode attributes QSOPracticeSession uses. Speccing the mock from this
+# list keeps it strict without importing the audio stack (pyaudio/numpy).
+MORSE_CODE_INTERFACE = ['play_string', 'stop_event', 'pause_event']
+
+# Upper bound on a gated playback. Tests release the gate explicitly, so this
+# only caps how long a stray playback thread can outlive its test.
+MAX_PLAYBACK_SECONDS = 1.0
+
+
+def gated_morse_code(test):
+    """
+    Return a mock MorseCode and the gate its playback blocks on.
+
+    play_string() stays "in progress" until the test sets the gate (or the
+    test finishes), so playback state can be asserted without sleeping.
+    """
+    gate = threading.Event()
+    test.addCleanup(gate.set)
+    mock_morse = MagicMock(spec=MORSE_CODE_INTERFACE)
+    mock_morse.play_string.side_effect = lambda text: gate.wait(MAX_PLAYBACK_SECONDS)
+    return mock_morse, gate
+
+
+# One seeded batch of minimal QSOs shared by every CachedGeneratorTestCase
+# session; those tests exercise state transitions, not QSO content. Built in
+# setUpModule so importing the module leaves the shared RNG untouched.
+SESSION_QSOS = ()
+
+
+class CachedQSOGenerator(QSOGenerator):
+    """QSOGenerator whose batches are served from SESSION_QSOS"""
+
+    def generate_multiple_qsos(self, count=10, verbosity='medium'):
+        # Only minimal QSOs are cached; fail loudly rather than serve the
+        # wrong verbosity
+        if verbosity != 'minimal':
+            raise ValueError(f"CachedQSOGenerator only serves minimal QSOs, not {verbosity!r}")
+        # Cycle the cached batch so large sessions cost no generation either
+        return list(itertools.islice(itertools.cycle(SESSION_QSOS), count))
+
+
+# State of the shared qso_data RNG before seeding, restored in tearDownModule
+_saved_rng_state = None
+
+
+def setUpModule():
+    """Generate the shared QSO batch and generator once for the whole module"""
+    global SESSION_QSOS, _saved_rng_state
+    # QSOGenerator(seed=...) reseeds the RNG shared by every generator
+    _saved_rng_state = qso_data._rng.getstate()
+    generator = QSOGenerator(seed=42)
+    SESSION_QSOS = tuple(generator.generate_multiple_qsos(count=3, verbosity='minimal'))
+
+
+def tearDownModule():
+    """Restore the shared RNG state"""
+    qso_data._rng.setstate(_saved_rng_state)
+
+
+class CachedGeneratorTestCase(unittest.TestCase):
+    """
+    Base class for session state tests that don't care about QSO content.
+
+    Every QSOPracticeSession built in the class gets a CachedQSOGenerator
+    instead of constructing its own.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch the session's generator for the whole class"""
+        super().setUpClass()
+        patcher = patch('qso_practice.QSOGenerator')
+        patcher.start().return_value = CachedQSOGenerator()
+        cls.addClassCleanup(patcher.stop)
+
+
+class InlineThread:
+    """threading.Thread stand-in that runs its target synchronously in start()"""
+
+    def __init__(self, group=None, target=None, *args, **kwargs):
+        self._target = target
+
+    def start(self):
+        self._target()
+
+    def is_alive(self):
+        return False
+
+    def join(self, timeout=None):
+        pass
+
+
+def fast_forward_to_complete(session):
+    """Put a started session straight into the state skipping every QSO leaves"""
+    session.current_qso_index = len(session.qsos)
+    session.current_qso = None
+    session._update_state('complete')
+
+
+def join_playback(session, timeout=1.0):
+    """Wait for the session's playback thread to exit; return True if it did"""
+    thread = session._playback_thread
+    if thread is not None:
+        thread.join(timeout)
+        return not thread.is_alive()
+    return True
+
+
+class TestQSOPracticeSession(CachedGeneratorTestCase):
     """Test QSO practice session state management"""
 
     def setUp(self):
-        # Create mock MorseCode object
-        self.mock_morse = MagicMock()
-        self.mock_morse.play_string = MagicMock(side_effect=lambda x: time.sleep(0.1))
+        # Create mock MorseCode object with gated playback
+        self.mock_morse, self.gate = gated_morse_code(self)
 
         # Create session
         self.session = QSOPracticeSession(
@@ -33,27 +145,60 @@ class TestQSOPracticeSession(unittest.TestCase):
             verbosity='minimal'
         )
 
-    def test_session_starts_in_ready_state(self):
-        """Test session initializes in ready state"""
-        self.session.start_session()
-        self.assertEqual(self.session.state, 'ready')
+        # Signalled by the session once playback has finished
+        self.playback_done = threading.Event()
+        self.session.set_playback_complete_callback(self.playback_done.set)
 
-    def test_playback_starts(self):
-        """Test playback transitions to playing state"""
+    def test_qso_count_limits(self):
+        """Test sessions accept 1-100 QSOs and reject counts outside that range"""
+        for qso_count in (1, 100):
+            with self.subTest(qso_count=qso_count):
+                session = QSOPracticeSession(morse_code=self.mock_morse, qso_count=qso_count)
+                self.assertEqual(session.qso_count, qso_count)
+
+        for qso_count in (0, 101):
+            with self.subTest(qso_count=qso_count):
+                with self.assertRaises(ValueError):
+                    QSOPracticeSession(morse_code=self.mock_morse, qso_count=qso_count)
+
+    def test_skip_to_completion(self):
+        """Test skipping every QSO completes the session"""
         self.session.start_session()
-        self.session.play_current_qso()
-        self.assertEqual(self.session.state, 'playing')
+        for _ in range(self.session.qso_count):
+            self.session.skip_current_qso()
+
+        self.assertEqual(self.session.state, 'complete')
+        self.assertEqual(self.session.current_qso_index, len(self.session.qsos))
+        self.assertIsNone(self.session.current_qso)
 
-    def test_playback_completes_to_transcribing(self):
-        """Test playback completes and transitions to transcribing"""
+    def test_restart_after_complete(self):
+        """Test a completed session can be started again"""
         self.session.start_session()
-        self.session.play_current_qso()
+        fast_forward_to_complete(self.session)
 
-        # Wait for playback to complete
-        time.sleep(0.3)
+        self.session.start_session()
+        self.assertEqual(self.session.state, 'ready')
+        self.assertEqual(self.session.current_qso_index, 0)
+        self.assertIs(self.session.current_qso, self.session.qsos[0])
+
+    def finish_playback(self):
+        """Let the mocked playback return and wait for the session to finish it"""
+        self.gate.set()
+        self.assertTrue(self.playback_done.wait(1.0))
+
+    def test_full_state_machine(self):
+        """Test one session through start, playback, transcribing and next QSO"""
+        steps = (
+            ('start', self.session.start_session, 'ready'),
+            ('play', self.session.play_current_qso, 'playing'),
+            ('playback complete', self.finish_playback, 'transcribing'),
+            ('next', self.session.next_qso, 'ready'),
+        )
 
-        # Should transition to transcribing
-        self.assertEqual(self.session.state, 'transcribing')
+        for step, action, expected_state in steps:
+            with self.subTest(step=step):
+                action()
+                self.assertEqual(self.session.state, expected_state)
 
     def test_pause_and_resume(self):
         """Test pause/resume functionality (bug we fixed)"""
@@ -77,8 +222,9 @@ class TestQSOPracticeSession(unittest.TestCase):
         # Stop
         self.session.stop_playback()
 
-        # Wait for thread to finish
-        time.sleep(0.2)
+        # Let the mocked playback return and wait for thread to finish
+        self.gate.set()
+        self.assertTrue(join_playback(self.session))
 
         # Should be in stopped or transcribing state
         self.assertIn(self.session.state, ['stopped', 'transcribing'])
@@ -88,21 +234,20 @@ class TestQSOPracticeSession(unittest.TestCase):
         self.session.start_session()
         self.session.play_current_qso()
 
-        # Wait for playback to complete
-        time.sleep(0.3)
+        self.finish_playback()
         self.assertEqual(self.session.state, 'transcribing')
 
-        # Replay should work
+        # Replay should work (hold the replayed playback open again)
+        self.gate.clear()
         self.session.replay_current_qso()
         self.assertEqual(self.session.state, 'playing')
 
 
-class TestSubmitDuringPlayback(unittest.TestCase):
+class TestSubmitDuringPlayback(CachedGeneratorTestCase):
     """Test the critical bug fix: submitting while QSO is playing"""
 
     def setUp(self):
-        self.mock_morse = MagicMock()
-        self.mock_morse.play_string = MagicMock(side_effect=lambda x: time.sleep(0.1))
+        self.mock_morse, self.gate = gated_morse_code(self)
         self.session = QSOPracticeSession(
             morse_code=self.mock_morse,
             qso_count=2,
@@ -157,12 +302,11 @@ class TestSubmitDuringPlayback(unittest.TestCase):
         self.assertEqual(self.session.state, 'ready')
 
 
-class TestStateCallbacks(unittest.TestCase):
+class TestStateCallbacks(CachedGeneratorTestCase):
     """Test state change callbacks work correctly"""
 
     def setUp(self):
-        self.mock_morse = MagicMock()
-        self.mock_morse.play_string = MagicMock(side_effect=lambda x: time.sleep(0.1))
+        self.mock_morse, self.gate = gated_morse_code(self)
         self.session = QSOPracticeSession(
             morse_code=self.mock_morse,
             qso_count=1,
@@ -185,24 +329,39 @@ class TestStateCallbacks(unittest.TestCase):
 
     def test_playback_complete_callback(self):
         """Test playback complete callback is triggered"""
+        # Only this session's playback thread runs inline
+        self.session._thread_factory = InlineThread
         callback = MagicMock()
         self.session.set_playback_complete_callback(callback)
 
+        # Playback runs inline on this thread, so release it up front
+        self.gate.set()
         self.session.start_session()
         self.session.play_current_qso()
 
-        # Wait for playback to complete
-        time.sleep(0.3)
+        # Callback should have been called before play_current_qso returned
+        callback.assert_called_once()
+        self.assertEqual(self.session.state, 'transcribing')
 
-        # Callback should be called
-        callback.assert_called()
+    def test_playback_thread_active(self):
+        """Test the playback thread is alive during playback and exits after"""
+        self.session.start_session()
+        self.session.play_current_qso()
+        self.assertTrue(self.session.is_playback_active())
+
+        # Release the mocked playback and join the thread rather than sleeping
+        self.gate.set()
+        self.assertTrue(join_playback(self.session))
+        self.assertFalse(self.session.is_playback_active())
 
 
 class TestQSOGenerator(unittest.TestCase):
     """Test QSO generation works"""
 
-    def setUp(self):
-        self.generator = QSOGenerator()
+    @classmethod
+    def setUpClass(cls):
+        """Build the generator once; the tests only read from it"""
+        cls.generator = QSOGenerator()
 
     def test_generate_minimal_qso(self):
         """Test minimal QSO generation"""
@@ -223,12 +382,26 @@ class TestQSOGenerator(unittest.TestCase):
         self.assertGreater(len(morse_text), 50)
         self.assertIsInstance(morse_text, str)
 
+    def test_session_generates_qsos(self):
+        """Test a session fills its QSO list through the real generator"""
+        mock_morse = MagicMock(spec=MORSE_CODE_INTERFACE)
+        session = QSOPracticeSession(morse_code=mock_morse, qso_count=2, verbosity='minimal')
+        session.start_session()
+
+        self.assertEqual(len(session.qsos), 2)
+        self.assertIs(session.current_qso, session.qsos[0])
+        for qso in session.qsos:
+            self.assertEqual(qso['verbosity'], 'minimal')
+            self.assertIn('full_text', qso)
+
 
 class TestQSOScoring(unittest.TestCase):
     """Test scoring functionality"""
 
-    def setUp(self):
-        self.scorer = QSOScorer(fuzzy_threshold=0.8, partial_credit=True)
+    @classmethod
+    def setUpClass(cls):
+        """Build the scorer once; the tests only inspect its settings"""
+        cls.scorer = QSOScorer(fuzzy_threshold=0.8, partial_credit=True)
 
     def test_scorer_creation(self):
         """Test scorer can be created"""
@@ -259,12 +432,11 @@ class TestSessionScorer(unittest.TestCase):
         self.assertEqual(summary['qso_count'], 0)  # No QSOs scored yet
 
 
-class TestRapidStateChanges(unittest.TestCase):
+class TestRapidStateChanges(CachedGeneratorTestCase):
     """Test rapid state changes don't cause crashes"""
 
     def setUp(self):
-        self.mock_morse = MagicMock()
-        self.mock_morse.play_string = MagicMock(side_effect=lambda x: time.sleep(0.1))
+        self.mock_morse, self.gate = gated_morse_code(self)
         self.session = QSOPracticeSession(
             morse_code=self.mock_morse,
             qso_count=1,
@@ -282,7 +454,8 @@ class TestRapidStateChanges(unittest.TestCase):
         self.session.pause_playback()
         self.session.stop_playback()
 
-        time.sleep(0.3)  # Wait for all threads to finish
+        self.gate.set()
+        self.assertTrue(join_playback(self.session))
 
         # Should end in a valid state without crashing
         self.assertIn(self.session.state, ['stopped', 'transcribing', 'ready'])
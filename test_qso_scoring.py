@@ -4,15 +4,44 @@ Unit tests for QSO Scoring System
 Tests answer validation, fuzzy matching, score calculation,
 and statistics tracking.
 
+Run with: python -m pytest test_qso_scoring.py -v
+
 Author: Generated with Claude Code
 Date: 2025-11-28
 Issue: #7 - QSO Feature: Scoring System
 """
 
 import unittest
+from unittest.mock import patch
+from types import MappingProxyType
 from qso_scoring import QSOScorer, SessionScorer
 
 
+# Sample correct elements shared (read-only) by every QSO scoring test
+CORRECT_ELEMENTS = MappingProxyType({
+    'callsigns': ('W1ABC', 'G3YWX'),
+    'names': ('BOB', 'IAN'),
+    'qths': ('BOSTON', 'LONDON'),
+    'rsts': ('599', '589'),
+    'rigs': ('IC7300', 'FT991A'),
+    'antennas': ('DIPOLE', 'VERTICAL'),
+    'powers': ('100W', '50W')
+})
+
+# Answers matching every required element of CORRECT_ELEMENTS; tests derive
+# their mistakes from this with {**PERFECT_ANSWERS, ...}
+PERFECT_ANSWERS = MappingProxyType({
+    'callsign1': 'W1ABC',
+    'callsign2': 'G3YWX',
+    'name1': 'BOB',
+    'name2': 'IAN',
+    'qth1': 'BOSTON',
+    'qth2': 'LONDON',
+    'rst1': '599',
+    'rst2': '589'
+})
+
+
 class TestQSOScorerInit(unittest.TestCase):
     """Test QSOScorer initialization."""
 
@@ -49,9 +78,10 @@ class TestQSOScorerInit(unittest.TestCase):
 class TestElementScoring(unittest.TestCase):
     """Test individual element scoring."""
 
-    def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer(fuzzy_threshold=0.8, partial_credit=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer(fuzzy_threshold=0.8, partial_credit=True)
 
     def test_exact_match(self):
         """Test exact match scoring."""
@@ -112,13 +142,23 @@ class TestElementScoring(unittest.TestCase):
         self.assertEqual(score, 0.0)
         self.assertEqual(feedback, 'incorrect')
 
+    def test_no_partial_credit_skips_fuzzy_matching(self):
+        """Test mismatches skip fuzzy matching when partial credit is off."""
+        scorer = QSOScorer(partial_credit=False)
+
+        with patch('qso_scoring._similarity') as mock_similarity:
+            scorer.score_element('BOSTN', 'BOSTON')
+
+        mock_similarity.assert_not_called()
+
 
 class TestCallsignScoring(unittest.TestCase):
     """Test callsign-specific scoring."""
 
-    def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer(fuzzy_threshold=0.8)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer(fuzzy_threshold=0.8)
 
     def test_exact_callsign(self):
         """Test exact callsign match."""
@@ -146,9 +186,10 @@ class TestCallsignScoring(unittest.TestCase):
 class TestRSTScoring(unittest.TestCase):
     """Test RST report scoring."""
 
-    def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer()
 
     def test_exact_rst(self):
         """Test exact RST match."""
@@ -183,35 +224,16 @@ class TestRSTScoring(unittest.TestCase):
 class TestQSOScoring(unittest.TestCase):
     """Test complete QSO scoring."""
 
-    def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer()
-
-        # Sample correct elements
-        self.correct_elements = {
-            'callsigns': ['W1ABC', 'G3YWX'],
-            'names': ['BOB', 'IAN'],
-            'qths': ['BOSTON', 'LONDON'],
-            'rsts': ['599', '589'],
-            'rigs': ['IC7300', 'FT991A'],
-            'antennas': ['DIPOLE', 'VERTICAL'],
-            'powers': ['100W', '50W']
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer()
 
     def test_perfect_score(self):
         """Test perfect QSO score."""
-        user_answers = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
-            'name2': 'IAN',
-            'qth1': 'BOSTON',
-            'qth2': 'LONDON',
-            'rst1': '599',
-            'rst2': '589'
-        }
+        user_answers = PERFECT_ANSWERS
 
-        result = self.scorer.score_qso(user_answers, self.correct_elements)
+        result = self.scorer.score_qso(user_answers, CORRECT_ELEMENTS)
 
         self.assertEqual(result['total_score'], 8.0)
         self.assertEqual(result['max_score'], 8)
@@ -222,17 +244,12 @@ class TestQSOScoring(unittest.TestCase):
     def test_partial_score(self):
         """Test QSO with some incorrect answers."""
         user_answers = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
+            **PERFECT_ANSWERS,
             'name2': 'JOHN',  # Incorrect
-            'qth1': 'BOSTON',
-            'qth2': 'LONDON',
-            'rst1': '599',
             'rst2': '579'  # Partially correct
         }
 
-        result = self.scorer.score_qso(user_answers, self.correct_elements)
+        result = self.scorer.score_qso(user_answers, CORRECT_ELEMENTS)
 
         self.assertLess(result['total_score'], 8.0)
         self.assertEqual(result['max_score'], 8)
@@ -242,21 +259,14 @@ class TestQSOScoring(unittest.TestCase):
     def test_with_optional_elements(self):
         """Test QSO with optional equipment fields."""
         user_answers = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
-            'name2': 'IAN',
-            'qth1': 'BOSTON',
-            'qth2': 'LONDON',
-            'rst1': '599',
-            'rst2': '589',
+            **PERFECT_ANSWERS,
             'rig1': 'IC7300',
             'rig2': 'FT991A',
             'antenna1': 'DIPOLE',
             'power1': '100W'
         }
 
-        result = self.scorer.score_qso(user_answers, self.correct_elements)
+        result = self.scorer.score_qso(user_answers, CORRECT_ELEMENTS)
 
         # 8 required + 4 optional = 12 max score
         self.assertEqual(result['max_score'], 12)
@@ -275,7 +285,7 @@ class TestQSOScoring(unittest.TestCase):
             'rst2': ''
         }
 
-        result = self.scorer.score_qso(user_answers, self.correct_elements)
+        result = self.scorer.score_qso(user_answers, CORRECT_ELEMENTS)
 
         self.assertEqual(result['total_score'], 0.0)
         self.assertEqual(result['max_score'], 8)
@@ -284,18 +294,9 @@ class TestQSOScoring(unittest.TestCase):
 
     def test_element_scores_structure(self):
         """Test that element scores have correct structure."""
-        user_answers = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
-            'name2': 'IAN',
-            'qth1': 'BOSTON',
-            'qth2': 'LONDON',
-            'rst1': '599',
-            'rst2': '589'
-        }
+        user_answers = PERFECT_ANSWERS
 
-        result = self.scorer.score_qso(user_answers, self.correct_elements)
+        result = self.scorer.score_qso(user_answers, CORRECT_ELEMENTS)
 
         # Check structure of element scores
         for key in ['callsign1', 'name1', 'qth1', 'rst1']:
@@ -310,9 +311,14 @@ class TestQSOScoring(unittest.TestCase):
 class TestStatistics(unittest.TestCase):
     """Test statistics tracking."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer()
+
     def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer()
+        """Start each test from zeroed statistics."""
+        self.scorer.reset_statistics()
 
     def test_initial_statistics(self):
         """Test initial statistics are zero."""
@@ -454,44 +460,20 @@ class TestIntegration(unittest.TestCase):
         session_scorer = SessionScorer(scorer)
 
         # Score multiple QSOs
-        correct_elements = {
-            'callsigns': ['W1ABC', 'G3YWX'],
-            'names': ['BOB', 'IAN'],
-            'qths': ['BOSTON', 'LONDON'],
-            'rsts': ['599', '589'],
-            'rigs': ['IC7300', 'FT991A'],
-            'antennas': ['DIPOLE', 'VERTICAL'],
-            'powers': ['100W', '50W']
-        }
-
         # QSO 1: Perfect
-        user_answers_1 = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
-            'name2': 'IAN',
-            'qth1': 'BOSTON',
-            'qth2': 'LONDON',
-            'rst1': '599',
-            'rst2': '589'
-        }
+        user_answers_1 = PERFECT_ANSWERS
 
-        result_1 = scorer.score_qso(user_answers_1, correct_elements)
+        result_1 = scorer.score_qso(user_answers_1, CORRECT_ELEMENTS)
         session_scorer.add_qso_score(result_1)
 
         # QSO 2: Some errors
         user_answers_2 = {
-            'callsign1': 'W1ABC',
-            'callsign2': 'G3YWX',
-            'name1': 'BOB',
+            **PERFECT_ANSWERS,
             'name2': 'JOHN',  # Wrong
-            'qth1': 'BOSTON',
-            'qth2': 'PARIS',  # Wrong
-            'rst1': '599',
-            'rst2': '589'
+            'qth2': 'PARIS'  # Wrong
         }
 
-        result_2 = scorer.score_qso(user_answers_2, correct_elements)
+        result_2 = scorer.score_qso(user_answers_2, CORRECT_ELEMENTS)
         session_scorer.add_qso_score(result_2)
 
         # Get session summary
@@ -505,9 +487,10 @@ class TestIntegration(unittest.TestCase):
 class TestFuzzyMatching(unittest.TestCase):
     """Test fuzzy matching edge cases."""
 
-    def setUp(self):
-        """Set up test scorer."""
-        self.scorer = QSOScorer(fuzzy_threshold=0.8)
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test scorer."""
+        cls.scorer = QSOScorer(fuzzy_threshold=0.8)
 
     def test_typo_tolerance(self):
         """Test tolerance for common typos."""
@@ -537,19 +520,6 @@ class TestFuzzyMatching(unittest.TestCase):
         self.assertEqual(score2, 1.0)
 
 
-def run_tests():
-    """Run all tests and return results."""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromModule(__import__(__name__))
-
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    return result
-
-
 if __name__ == '__main__':
-    result = run_tests()
-    exit(0 if result.wasSuccessful() else 1)
+    # unittest.main supports -k patterns for running a subset of tests
+    unittest.main(verbosity=2)
@@ -0,0 +1,245 @@
+"""
+Unit tests for QSOTemplate variable substitution
+
+Tests substituting variables into generated templates, validation of
+substituted values, and the complete generate-and-substitute workflow.
+
+Run with: python -m pytest test_qso_template_substitution.py -v
+
+Author: Generated with Claude Code
+Date: 2025-11-28
+Issue: #4 - QSO Feature: Template System
+"""
+
+import unittest
+import itertools
+from types import MappingProxyType
+from qso_data import QSOTemplate, CallSignGenerator
+from qso_template_helpers import PLACEHOLDER_RE, template_pool
+import qso_data
+
+
+# Valid values for every template variable, shared read-only by the
+# substitution tests; negative tests override one key with {**VALID_VARS, ...}
+VALID_VARS = MappingProxyType({
+    'CALL1': 'W1ABC',
+    'CALL2': 'G3XYZ',
+    'NAME1': 'BOB',
+    'NAME2': 'JOHN',
+    'QTH1': 'BOSTON',
+    'QTH2': 'LONDON',
+    'RST1': '599',
+    'RST2': '579',
+    'RIG1': 'IC7300',
+    'RIG2': 'FT991A',
+    'ANT1': 'DIPOLE',
+    'ANT2': 'BEAM',
+    'PWR1': '100W',
+    'PWR2': '50W',
+    'WX1': 'SUNNY',
+    'WX2': 'CLOUDY',
+    'TEMP1': '20C',
+    'TEMP2': '15C',
+})
+
+# Source list for each numbered template variable (call signs are generated)
+_VARIABLE_SOURCES = (
+    ('NAME', qso_data.COMMON_NAMES),
+    ('QTH', qso_data.ALL_CITIES),
+    ('RST', qso_data.RST_REPORTS),
+    ('RIG', qso_data.TRANSCEIVERS),
+    ('ANT', qso_data.ANTENNAS),
+    ('PWR', qso_data.POWER_LEVELS),
+    ('WX', qso_data.WEATHER_CONDITIONS),
+    ('TEMP', qso_data.TEMPERATURES),
+)
+
+
+def _build_variable_pool(count):
+    """Build variable sets where set i uses entries i and i+1 of each source list."""
+    pool = [{} for _ in range(count)]
+    for name, values in _VARIABLE_SOURCES:
+        cycled = tuple(itertools.islice(itertools.cycle(values), count + 1))
+        for variables, first, second in zip(pool, cycled, cycled[1:]):
+            variables[f'{name}1'] = first
+            variables[f'{name}2'] = second
+    return tuple(pool)
+
+
+VARIABLE_POOL = _build_variable_pool(10)
+
+# Shared call sign generator
+_CALL_GEN = CallSignGenerator()
+
+
+class TestSubstituteVariables(unittest.TestCase):
+    """Test variable substitution functionality."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared template."""
+        cls.template = QSOTemplate()
+
+    def test_substitute_basic_template(self):
+        """Test substitution with a simple template."""
+        template_str = "CQ DE {CALL1} = NAME {NAME1} = QTH {QTH1} K"
+        result = self.template.substitute_variables(template_str, VALID_VARS)
+
+        self.assertIn('W1ABC', result)
+        self.assertIn('BOB', result)
+        self.assertIn('BOSTON', result)
+        self.assertIsNone(PLACEHOLDER_RE.search(result))
+
+    def test_substitute_all_variables(self):
+        """Test that all variables get substituted."""
+        # This exercises the real (validating) substitution path on purpose
+        for template_str in template_pool('chatty'):
+            result = self.template.substitute_variables(template_str, VALID_VARS)
+
+            # No placeholders should remain (one regex scan covers them all)
+            self.assertIsNone(PLACEHOLDER_RE.search(result))
+
+    def test_substitute_uppercase_conversion(self):
+        """Test that substituted values are converted to uppercase."""
+        # The substitute_variables method converts values to uppercase
+        # But validation requires proper format, so use valid values
+        vars_mixed = {**VALID_VARS, 'RST1': '599'}  # Valid RST
+
+        template_str = "RST {RST1}"
+        result = self.template.substitute_variables(template_str, vars_mixed)
+
+        # Should be uppercase
+        self.assertIn('599', result)
+        self.assertIsInstance(result, str)
+        self.assertFalse(any(map(str.islower, result)))
+
+    # (variable, override value or None to omit it, expected error, template)
+    INVALID_CASES = (
+        ('CALL1', None, KeyError, "CQ DE {CALL1} K"),  # Missing variable
+        ('CALL1', 'INVALID123456789', ValueError, "CQ DE {CALL1} K"),  # Too long
+        ('NAME1', '123', ValueError, "NAME {NAME1}"),  # Numbers only
+        ('RST1', '999', ValueError, "UR RST {RST1}"),  # Invalid (R can't be 9)
+        ('PWR1', '5000W', ValueError, "PWR {PWR1}"),  # Too high
+    )
+
+    def test_substitute_invalid_variables_raise_errors(self):
+        """Test that missing or invalid variables raise errors."""
+        for key, value, error, template_str in self.INVALID_CASES:
+            if value is None:
+                variables = {k: v for k, v in VALID_VARS.items() if k != key}
+            else:
+                variables = {**VALID_VARS, key: value}
+
+            with self.subTest(key=key, value=value):
+                with self.assertRaises(error):
+                    self.template.substitute_variables(template_str, variables)
+
+
+class TestTemplateIntegration(unittest.TestCase):
+    """Test integration of template generation and substitution."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test components."""
+        cls.template = QSOTemplate()
+
+        minimal_vars = {
+            'CALL1': _CALL_GEN.generate('us'),
+            'CALL2': _CALL_GEN.generate('uk'),
+            'NAME1': qso_data.COMMON_NAMES[0],
+            'NAME2': qso_data.COMMON_NAMES[1],
+            'QTH1': qso_data.US_CITIES[0],
+            'QTH2': qso_data.UK_CITIES[0],
+            'RST1': '599',
+            'RST2': '579',
+            'RIG1': qso_data.TRANSCEIVERS[0],
+            'RIG2': qso_data.TRANSCEIVERS[1],
+            'ANT1': qso_data.ANTENNAS[0],
+            'ANT2': qso_data.ANTENNAS[1],
+            'PWR1': '100W',
+            'PWR2': '50W',
+            'WX1': qso_data.WEATHER_CONDITIONS[0],
+            'WX2': qso_data.WEATHER_CONDITIONS[1],
+            'TEMP1': '20C',
+            'TEMP2': '15C',
+        }
+
+        # (verbosity, variables, values expected in the substituted QSO)
+        cls.workflow_cases = (
+            ('minimal', minimal_vars, (minimal_vars['NAME1'], minimal_vars['NAME2'])),
+            ('medium', {
+                'CALL1': 'W1ABC',
+                'CALL2': 'DL1XYZ',
+                'NAME1': 'MIKE',
+                'NAME2': 'HANS',
+                'QTH1': 'CHICAGO',
+                'QTH2': 'BERLIN',
+                'RST1': '589',
+                'RST2': '569',
+                'RIG1': 'IC7300',
+                'RIG2': 'TS590',
+                'ANT1': 'DIPOLE',
+                'ANT2': 'YAGI',
+                'PWR1': '100W',
+                'PWR2': '75W',
+                'WX1': 'CLEAR',
+                'WX2': 'RAIN',
+                'TEMP1': '25C',
+                'TEMP2': '10C',
+            }, ('IC7300', 'TS590')),  # Equipment information
+            ('chatty', {
+                'CALL1': 'VK3ABC',
+                'CALL2': 'JA1XYZ',
+                'NAME1': 'TOM',
+                'NAME2': 'YOSHI',
+                'QTH1': 'SYDNEY',
+                'QTH2': 'TOKYO',
+                'RST1': '599',
+                'RST2': '559',
+                'RIG1': 'K3',
+                'RIG2': 'FT991A',
+                'ANT1': 'BEAM',
+                'ANT2': 'VERTICAL',
+                'PWR1': '100W',
+                'PWR2': '50W',
+                'WX1': 'SUNNY',
+                'WX2': 'CLOUDY',
+                'TEMP1': '30C',
+                'TEMP2': '15C',
+            }, ('SUNNY', 'CLOUDY', '30C', '15C')),  # Weather information
+        )
+
+    def test_generate_and_substitute(self):
+        """Test complete workflow for each verbosity level."""
+        for verbosity, variables, expected in self.workflow_cases:
+            with self.subTest(verbosity=verbosity):
+                template_str = self.template.generate(verbosity)
+                result = self.template.substitute_variables(template_str, variables)
+
+                # Result should be valid
+                self.assertIsInstance(result, str)
+                self.assertGreater(len(result), 0)
+
+                # Should contain actual values
+                for value in expected:
+                    self.assertIn(value, result)
+
+    def test_multiple_qsos_are_unique(self):
+        """Test that multiple QSO generations produce variety."""
+        qsos = {
+            self.template.substitute_variables(template_str, {
+                **variables,
+                'CALL1': _CALL_GEN.generate(),
+                'CALL2': _CALL_GEN.generate(),
+            })
+            for template_str, variables in zip(
+                itertools.cycle(template_pool('medium')), VARIABLE_POOL
+            )
+        }
+
+        # Should have variety in generated QSOs
+        self.assertGreater(len(qsos), 5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)